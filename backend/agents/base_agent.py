@@ -1,21 +1,80 @@
 """
 Base Research Agent - Implements the ReAct (Reason-Act-Observe) pattern.
 """
+import asyncio
+import logging
+import re
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import structlog
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import TypeAdapter, ValidationError
 
 from backend.app.models import AgentStep, AgentTrace, SourceInfo
+from backend.agents.llm_batcher import LLMBatcher
+from backend.agents.llm_cache import LLMResponseCache
+from backend.config.settings import get_settings
 from backend.tools.base_tool import BaseTool
 
 logger = structlog.get_logger()
 
 
+def _compile_keyword_pattern(templates: Dict[str, str]) -> "re.Pattern[str]":
+    """Compile keyword templates into one alternation for a single-pass scan."""
+    return re.compile("|".join(re.escape(keyword) for keyword in templates))
+
+
+def _match_keyword_template(
+    thought_lower: str,
+    pattern: "re.Pattern[str]",
+    templates: Dict[str, str]
+) -> Optional[str]:
+    """
+    Scan the thought once and return the highest-priority matching template.
+
+    Priority is the insertion order of the templates dict, matching the
+    behavior of the if/elif chains this replaces.
+    """
+    matches = {match.group(0) for match in pattern.finditer(thought_lower)}
+    if not matches:
+        return None
+
+    for keyword, template in templates.items():
+        if keyword in matches:
+            return template
+
+    return None
+
+
+# Keyword -> action-input template used by the base _act. Matched in one
+# precompiled pass; dict order defines priority when several keywords hit.
+_ACTION_KEYWORD_TEMPLATES = {
+    "news": "{ticker} recent news earnings",
+    "recent": "{ticker} recent news earnings",
+    "filing": "{ticker} SEC filings 10-K 10-Q",
+    "sec": "{ticker} SEC filings 10-K 10-Q",
+    "earnings": "{ticker} earnings call transcript",
+    "transcript": "{ticker} earnings call transcript",
+    "insider": "{ticker} insider trading ownership",
+    "ownership": "{ticker} insider trading ownership",
+    "patent": "{ticker} patents research papers",
+    "research": "{ticker} patents research papers",
+    "price": "{ticker} stock price technical analysis",
+    "technical": "{ticker} stock price technical analysis",
+}
+
+_ACTION_KEYWORD_PATTERN = _compile_keyword_pattern(_ACTION_KEYWORD_TEMPLATES)
+
+# Validates a whole batch of source dicts in one C-level pass instead of
+# constructing SourceInfo models one at a time
+_SOURCE_LIST_ADAPTER = TypeAdapter(List[SourceInfo])
+
+
 class BaseResearchAgent(ABC):
     """
     Base class for all research agents implementing the ReAct pattern.
@@ -25,11 +84,44 @@ class BaseResearchAgent(ABC):
     2. Act: Use a tool to gather information
     3. Observe: Process the results and decide whether to continue
     """
-    
-    def __init__(self, llm: BaseChatModel, agent_type: str):
+
+    # Cap on concurrent tool calls per agent (respects API rate limits)
+    max_tool_concurrency = 4
+
+    # Deadline for one step's tool dispatch, bounding tail latency when a
+    # tool API degrades
+    step_deadline_s = 30.0
+
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        agent_type: str,
+        cache: Optional[LLMResponseCache] = None,
+        batcher: Optional[LLMBatcher] = None
+    ):
         self.llm = llm
         self.agent_type = agent_type
+        self.cache = cache
+        self.batcher = batcher
         self.tools = self._initialize_tools()
+        self._tools_by_name = {tool.name: tool for tool in self.tools}
+        self._tool_semaphore = asyncio.Semaphore(self.max_tool_concurrency)
+
+        # Tools and the system prompt are fixed per instance; format once
+        # instead of on every ReAct iteration
+        self._system_prompt = self._get_system_prompt()
+        self._tools_formatted = self._format_tools()
+        self._system_message = SystemMessage(content=self._system_prompt)
+
+        # Checked before per-iteration log calls so disabled levels skip
+        # building the event dict entirely. The threshold comes from the
+        # settings value main.py feeds to make_filtering_bound_logger; the
+        # stdlib root logger is never configured in this stack.
+        self._log_info_enabled = (
+            getattr(logging, get_settings().log_level.upper(), logging.INFO)
+            <= logging.INFO
+        )
         
     @abstractmethod
     def _initialize_tools(self) -> List[BaseTool]:
@@ -40,7 +132,46 @@ class BaseResearchAgent(ABC):
     def _get_system_prompt(self) -> str:
         """Get the system prompt for this agent."""
         pass
-    
+
+    @classmethod
+    async def research_many(
+        cls,
+        agents: List["BaseResearchAgent"],
+        ticker: str,
+        query: str,
+        max_iterations: int = 3,
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Run multiple agents' research loops concurrently.
+
+        Each agent's ReAct loop is independent I/O (LLM and tool HTTP calls),
+        so running them concurrently brings total wall time down to the
+        slowest agent instead of the sum of all agents.
+
+        Args:
+            agents: Agent instances to run
+            ticker: Stock ticker symbol
+            query: Original user query
+            max_iterations: Maximum ReAct iterations per agent
+            max_concurrency: Maximum number of agents running at once
+                (bounds pressure on LLM provider rate limits)
+
+        Returns:
+            List of research results in the same order as agents; entries
+            are exceptions for agents that failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_agent(agent: "BaseResearchAgent") -> Dict[str, Any]:
+            async with semaphore:
+                return await agent.research(ticker, query, max_iterations)
+
+        return await asyncio.gather(
+            *(run_agent(agent) for agent in agents),
+            return_exceptions=True
+        )
+
     async def research(
         self, 
         ticker: str, 
@@ -58,9 +189,9 @@ class BaseResearchAgent(ABC):
         Returns:
             Dictionary containing research results and execution trace
         """
-        start_time = time.time()
-        
-        logger.info("Starting research", 
+        start_ns = time.perf_counter_ns()
+
+        logger.info("Starting research",
                    agent_type=self.agent_type,
                    ticker=ticker,
                    max_iterations=max_iterations)
@@ -73,55 +204,65 @@ class BaseResearchAgent(ABC):
             success=False
         )
         
-        # Initialize context
+        # Initialize context. Findings are stored SoA-style in bounded ring
+        # buffers; the public list-of-dicts view is assembled at return time.
         context = {
             "ticker": ticker,
             "query": query,
-            "findings": [],
+            "thoughts": deque(maxlen=max_iterations),
+            "actions": deque(maxlen=max_iterations),
+            "observations": deque(maxlen=max_iterations),
+            "step_sources": deque(maxlen=max_iterations),
             "sources": [],
             "iteration": 0
         }
+
+        # Seed the prompt buffer with the static prefix; per-iteration
+        # deltas are appended so _reason never re-formats prior findings
+        context["prompt_parts"] = self._init_prompt_parts(context)
         
         try:
             # Run ReAct loop
             for iteration in range(max_iterations):
                 context["iteration"] = iteration + 1
                 
-                logger.info("Starting ReAct iteration", 
-                           agent_type=self.agent_type,
-                           ticker=ticker,
-                           iteration=iteration + 1)
+                if self._log_info_enabled:
+                    logger.info("Starting ReAct iteration",
+                               agent_type=self.agent_type,
+                               ticker=ticker,
+                               iteration=iteration + 1)
                 
-                step_start_time = time.time()
+                step_start_ns = time.perf_counter_ns()
                 
                 # REASON: Think about what to do next
                 thought = await self._reason(context, trace.steps)
                 
                 # Check if agent thinks it's done
                 if self._is_done(thought):
-                    logger.info("Agent decided to stop", 
-                               agent_type=self.agent_type,
-                               ticker=ticker,
-                               iteration=iteration + 1)
+                    if self._log_info_enabled:
+                        logger.info("Agent decided to stop",
+                                   agent_type=self.agent_type,
+                                   ticker=ticker,
+                                   iteration=iteration + 1)
                     break
                 
                 # ACT: Choose and execute a tool
                 action, action_input = await self._act(thought, context)
                 
                 # Execute the action
-                observation, sources = await self._execute_action(action, action_input, ticker)
+                observation, sources = await self._execute_action(
+                    action, action_input, ticker, thought=thought
+                )
                 
                 # Update context with new findings
-                context["findings"].append({
-                    "thought": thought,
-                    "action": action,
-                    "observation": observation,
-                    "sources": sources
-                })
+                context["thoughts"].append(thought)
+                context["actions"].append(action)
+                context["observations"].append(observation)
+                context["step_sources"].append(sources)
                 context["sources"].extend(sources)
                 
                 # Record the step
-                step_latency = (time.time() - step_start_time) * 1000
+                step_latency = (time.perf_counter_ns() - step_start_ns) // 1_000_000
                 step = AgentStep(
                     step_number=iteration + 1,
                     thought=thought,
@@ -131,18 +272,20 @@ class BaseResearchAgent(ABC):
                     latency_ms=step_latency
                 )
                 trace.steps.append(step)
-                
-                logger.info("Completed ReAct step", 
-                           agent_type=self.agent_type,
-                           ticker=ticker,
-                           iteration=iteration + 1,
-                           latency_ms=step_latency)
+                self._append_prompt_delta(context, step)
+
+                if self._log_info_enabled:
+                    logger.info("Completed ReAct step",
+                               agent_type=self.agent_type,
+                               ticker=ticker,
+                               iteration=iteration + 1,
+                               latency_ms=step_latency)
             
             # Mark as successful
             trace.success = True
             
             # Calculate total latency
-            total_latency = (time.time() - start_time) * 1000
+            total_latency = (time.perf_counter_ns() - start_ns) // 1_000_000
             trace.total_latency_ms = total_latency
             
             logger.info("Research completed", 
@@ -153,7 +296,7 @@ class BaseResearchAgent(ABC):
             
             return {
                 "trace": trace,
-                "findings": context["findings"],
+                "findings": self._findings_as_dicts(context),
                 "sources": context["sources"],
                 "summary": await self._summarize_findings(context)
             }
@@ -166,12 +309,12 @@ class BaseResearchAgent(ABC):
             
             trace.success = False
             trace.error_message = str(e)
-            trace.total_latency_ms = (time.time() - start_time) * 1000
+            trace.total_latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return {
                 "trace": trace,
                 "error": str(e),
-                "findings": context.get("findings", []),
+                "findings": self._findings_as_dicts(context),
                 "sources": context.get("sources", [])
             }
     
@@ -187,41 +330,105 @@ class BaseResearchAgent(ABC):
             Thought about what to do next
         """
         # Build the reasoning prompt
-        system_prompt = self._get_system_prompt()
-        
-        # Create context summary
-        context_summary = f"""
-        Ticker: {context['ticker']}
-        Original Query: {context['query']}
-        Current Iteration: {context['iteration']}
-        
-        Previous Findings:
-        {self._format_findings(context['findings'])}
-        
-        Available Tools:
-        {self._format_tools()}
-        """
-        
-        if previous_steps:
-            context_summary += f"\n\nPrevious Steps:\n{self._format_previous_steps(previous_steps)}"
-        
+        system_prompt = self._system_prompt
+
+        # Reuse the append-only prompt buffer; only the per-iteration tail
+        # is formatted here. Seed it lazily for direct _reason calls.
+        prompt_parts = context.get("prompt_parts")
+        if prompt_parts is None:
+            prompt_parts = self._init_prompt_parts(context, previous_steps)
+            context["prompt_parts"] = prompt_parts
+
         reasoning_prompt = f"""
-        {context_summary}
-        
-        Think step by step about what you should do next to gather relevant information about {context['ticker']} 
+        {''.join(prompt_parts)}
+        Current Iteration: {context['iteration']}
+
+        Think step by step about what you should do next to gather relevant information about {context['ticker']}
         related to the query: "{context['query']}"
-        
+
         If you have gathered sufficient information, respond with "DONE: [brief summary]"
         Otherwise, explain what specific information you need to gather next and which tool would be best to use.
         """
         
+        # The system message is invariant per agent; only the human message
+        # changes between iterations
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message,
             HumanMessage(content=reasoning_prompt)
         ]
-        
-        response = await self.llm.ainvoke(messages)
-        return response.content.strip()
+
+        return await self._invoke_llm(system_prompt, reasoning_prompt, messages, stream=True)
+
+    async def _invoke_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        messages: List[Any],
+        stream: bool = False
+    ) -> str:
+        """
+        Invoke the LLM, consulting the response cache when one is configured.
+
+        Args:
+            system_prompt: System prompt content (part of the cache key)
+            user_prompt: User prompt content (part of the cache key)
+            messages: Messages to send on a cache miss
+            stream: Stream the response and stop decoding early when the
+                agent signals DONE (batched calls cannot stream)
+
+        Returns:
+            Stripped LLM response content
+        """
+        key = None
+        if self.cache is not None:
+            key = LLMResponseCache.make_key(self.agent_type, system_prompt, user_prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug("LLM cache hit", agent_type=self.agent_type)
+                return cached
+
+        if self.batcher is not None:
+            content = (await self.batcher.ainvoke(messages)).content.strip()
+        elif stream:
+            content = await self._collect_stream(messages)
+        else:
+            content = (await self.llm.ainvoke(messages)).content.strip()
+
+        if self.cache is not None:
+            self.cache.put(key, content)
+
+        return content
+
+    async def _collect_stream(self, messages: List[Any]) -> str:
+        """
+        Accumulate a streamed response, stopping early on a DONE prefix.
+
+        The loop only inspects the prefix of a DONE thought, so once enough
+        of it has arrived the remaining completion tokens are not worth
+        waiting for. Falls back to ainvoke when the model does not support
+        async streaming.
+        """
+        chunks: List[str] = []
+        length = 0
+        checked_done = False
+
+        try:
+            async for chunk in self.llm.astream(messages):
+                text = getattr(chunk, "content", "") or ""
+                if text:
+                    chunks.append(text)
+                    length += len(text)
+
+                if not checked_done and length >= 16:
+                    checked_done = True
+                    if "".join(chunks).lstrip()[:5].upper() == "DONE:":
+                        break
+        except (AttributeError, TypeError, NotImplementedError):
+            # Model (or test double) does not expose a usable astream
+            response = await self.llm.ainvoke(messages)
+            return response.content.strip()
+
+        return "".join(chunks).strip()
     
     async def _act(self, thought: str, context: Dict[str, Any]) -> tuple[str, str]:
         """
@@ -236,113 +443,185 @@ class BaseResearchAgent(ABC):
         """
         # Simple action selection based on keywords in the thought
         # In a more sophisticated implementation, you'd use the LLM to parse the thought
-        
-        thought_lower = thought.lower()
+
+        # Casefold once; _pick_query and subclass overrides reuse it
+        thought_lower = thought.casefold()
         ticker = context['ticker']
-        
-        # Default to web search if no specific tool is mentioned
-        action = "web_search"
-        action_input = f"{ticker} stock analysis news"
-        
+
         # Check for specific tool mentions
+        matched_tool = None
         for tool in self.tools:
-            if tool.name.lower() in thought_lower:
-                action = tool.name
-                action_input = f"{ticker}"
+            if tool.name.casefold() in thought_lower:
+                matched_tool = tool
                 break
-        
+
+        if matched_tool is not None:
+            action = matched_tool.name
+            default_input = f"{ticker}"
+        else:
+            # Default to web search if no specific tool is mentioned
+            action = "web_search"
+            default_input = f"{ticker} stock analysis news"
+
         # Customize action input based on the thought
-        if "news" in thought_lower or "recent" in thought_lower:
-            action_input = f"{ticker} recent news earnings"
-        elif "filing" in thought_lower or "sec" in thought_lower:
-            action_input = f"{ticker} SEC filings 10-K 10-Q"
-        elif "earnings" in thought_lower or "transcript" in thought_lower:
-            action_input = f"{ticker} earnings call transcript"
-        elif "insider" in thought_lower or "ownership" in thought_lower:
-            action_input = f"{ticker} insider trading ownership"
-        elif "patent" in thought_lower or "research" in thought_lower:
-            action_input = f"{ticker} patents research papers"
-        elif "price" in thought_lower or "technical" in thought_lower:
-            action_input = f"{ticker} stock price technical analysis"
-        
+        action_input = self._pick_query(thought_lower, ticker)
+        if action_input is None:
+            action_input = default_input
+
         return action, action_input
+
+    def _pick_query(self, thought_lower: str, ticker: str) -> Optional[str]:
+        """
+        Pick an action input for the (already casefolded) thought.
+
+        Subclasses override this instead of _act to customize their search
+        queries. Returns None when no keyword matches, letting _act fall
+        back to its default input.
+        """
+        template = _match_keyword_template(
+            thought_lower, _ACTION_KEYWORD_PATTERN, _ACTION_KEYWORD_TEMPLATES
+        )
+        if template is not None:
+            return template.format(ticker=ticker)
+        return None
     
     async def _execute_action(
-        self, 
-        action: str, 
-        action_input: str, 
-        ticker: str
+        self,
+        action: str,
+        action_input: str,
+        ticker: str,
+        thought: str = ""
     ) -> tuple[str, List[SourceInfo]]:
         """
-        Execute the chosen action using the appropriate tool.
-        
+        Execute the chosen action, fanning out to every relevant tool.
+
+        The tool named by the action always runs; any other tool mentioned
+        in the thought runs concurrently with it, since tool calls are pure
+        I/O and their observations and sources merge trivially.
+
         Args:
-            action: Name of the action/tool to use
+            action: Name of the primary action/tool to use
             action_input: Input for the action
             ticker: Stock ticker
-            
+            thought: The reasoning that led to this action
+
         Returns:
             Tuple of (observation, sources)
         """
-        # Find the tool
-        tool = None
-        for t in self.tools:
-            if t.name == action:
-                tool = t
-                break
-        
-        if not tool:
-            # Fallback to first available tool
-            tool = self.tools[0] if self.tools else None
-            
-        if not tool:
+        if not self.tools:
             return "No tools available", []
-        
+
+        # Collect the named tool plus any other tool the thought mentions
+        thought_lower = thought.lower()
+        primary = self._tools_by_name.get(action)
+        candidates = [primary] if primary is not None else []
+        for tool in self.tools:
+            if tool is not primary and tool.name.lower() in thought_lower:
+                candidates.append(tool)
+
+        if not candidates:
+            # Fallback to first available tool
+            candidates = [self.tools[0]]
+
+        async def run_tool(tool: BaseTool):
+            async with self._tool_semaphore:
+                return await tool.execute(action_input, ticker)
+
         try:
-            # Execute the tool
-            result = await tool.execute(action_input, ticker)
-            
-            # Extract observation and sources
+            async with asyncio.timeout(self.step_deadline_s):
+                results = await asyncio.gather(
+                    *(run_tool(tool) for tool in candidates),
+                    return_exceptions=True
+                )
+        except TimeoutError:
+            logger.error("Tool execution timed out",
+                        tools=[tool.name for tool in candidates],
+                        ticker=ticker,
+                        deadline_s=self.step_deadline_s)
+            return f"Tool execution timed out after {self.step_deadline_s}s", []
+
+        # Merge observations and sources from all tools
+        observations = []
+        sources: List[SourceInfo] = []
+
+        for tool, result in zip(candidates, results):
+            if isinstance(result, Exception):
+                logger.error("Tool execution failed",
+                            tool=tool.name,
+                            ticker=ticker,
+                            error=str(result))
+                observations.append(f"Tool execution failed: {str(result)}")
+                continue
+
             if isinstance(result, dict):
-                observation = result.get("observation", str(result))
-                sources_data = result.get("sources", [])
-                
-                # Convert sources to SourceInfo objects
-                sources = []
-                for source_data in sources_data:
-                    if isinstance(source_data, dict):
-                        source = SourceInfo(
-                            url=source_data.get("url", ""),
-                            title=source_data.get("title"),
-                            published_at=source_data.get("published_at"),
-                            snippet=source_data.get("snippet")
+                observations.append(result.get("observation", str(result)))
+
+                # Convert sources to SourceInfo objects in one batch pass
+                sources_data = [
+                    source_data for source_data in result.get("sources", [])
+                    if isinstance(source_data, dict)
+                ]
+                if sources_data:
+                    try:
+                        sources.extend(_SOURCE_LIST_ADAPTER.validate_python(sources_data))
+                    except ValidationError:
+                        # Malformed entries: fall back to per-item defaults
+                        sources.extend(
+                            SourceInfo(
+                                url=source_data.get("url", ""),
+                                title=source_data.get("title"),
+                                published_at=source_data.get("published_at"),
+                                snippet=source_data.get("snippet")
+                            )
+                            for source_data in sources_data
                         )
-                        sources.append(source)
-                
-                return observation, sources
             else:
-                return str(result), []
-                
-        except Exception as e:
-            logger.error("Tool execution failed", 
-                        tool=action, 
-                        ticker=ticker, 
-                        error=str(e))
-            return f"Tool execution failed: {str(e)}", []
+                observations.append(str(result))
+
+        return "\n".join(observations), sources
     
     def _is_done(self, thought: str) -> bool:
         """Check if the agent thinks it's done."""
-        return thought.upper().startswith("DONE:")
+        # Only the first five characters matter; upper-casing just that
+        # slice avoids copying the whole response
+        prefix = thought.lstrip()[:5]
+        return len(prefix) == 5 and prefix.upper() == "DONE:"
     
+    def _findings_as_dicts(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Assemble the public findings view from the SoA ring buffers."""
+        return [
+            {
+                "thought": thought,
+                "action": action,
+                "observation": observation,
+                "sources": sources
+            }
+            for thought, action, observation, sources in zip(
+                context["thoughts"],
+                context["actions"],
+                context["observations"],
+                context["step_sources"]
+            )
+        ]
+
     async def _summarize_findings(self, context: Dict[str, Any]) -> str:
         """Summarize the research findings."""
-        if not context["findings"]:
+        observations = context["observations"]
+        if not observations:
             return "No significant findings."
-        
-        findings_text = "\n".join([
-            f"- {finding['observation']}" 
-            for finding in context["findings"]
-        ])
+
+        # A single observation would just be echoed back by the LLM
+        if len(observations) == 1:
+            return observations[0][:500]
+
+        findings_text = "\n".join(
+            f"- {observation}"
+            for observation in observations
+        )
+
+        # Short enough to present directly without a summarization round-trip
+        if len(findings_text) < 300:
+            return findings_text
         
         summary_prompt = f"""
         Summarize the following research findings for {context['ticker']}:
@@ -352,14 +631,41 @@ class BaseResearchAgent(ABC):
         Provide a concise summary highlighting the most important insights.
         """
         
+        summary_system_prompt = "You are a financial research analyst. Provide clear, concise summaries."
         messages = [
-            SystemMessage(content="You are a financial research analyst. Provide clear, concise summaries."),
+            SystemMessage(content=summary_system_prompt),
             HumanMessage(content=summary_prompt)
         ]
-        
-        response = await self.llm.ainvoke(messages)
-        return response.content.strip()
+
+        return await self._invoke_llm(summary_system_prompt, summary_prompt, messages)
     
+    def _init_prompt_parts(
+        self,
+        context: Dict[str, Any],
+        previous_steps: Optional[List[AgentStep]] = None
+    ) -> List[str]:
+        """Build the static prompt prefix shared by every iteration."""
+        parts = [
+            f"Ticker: {context['ticker']}\n"
+            f"Original Query: {context['query']}\n\n"
+            f"Available Tools:\n{self._tools_formatted}\n"
+        ]
+
+        # Direct _reason calls may arrive with pre-existing history
+        if context.get("findings"):
+            parts.append(f"\nPrevious Findings:\n{self._format_findings(context['findings'])}\n")
+        if previous_steps:
+            parts.append(f"\nPrevious Steps:\n{self._format_previous_steps(previous_steps)}\n")
+
+        return parts
+
+    def _append_prompt_delta(self, context: Dict[str, Any], step: AgentStep):
+        """Append one completed step's findings to the prompt buffer."""
+        context["prompt_parts"].append(
+            f"\nFinding {step.step_number}: {step.observation}\n"
+            f"Step {step.step_number}: {step.thought} -> {step.action} -> {step.observation[:100]}...\n"
+        )
+
     def _format_findings(self, findings: List[Dict[str, Any]]) -> str:
         """Format findings for display."""
         if not findings:
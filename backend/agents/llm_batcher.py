@@ -0,0 +1,93 @@
+"""
+Micro-batching wrapper for LLM calls shared across agents.
+"""
+import asyncio
+from typing import Any, List, Optional
+import structlog
+
+logger = structlog.get_logger()
+
+
+class LLMBatcher:
+    """
+    Batches concurrent LLM calls into single abatch requests.
+
+    When several agents (or tickers) reason at the same time, each would
+    normally issue its own HTTP round-trip. The batcher collects requests
+    that arrive within a short window and submits them together through
+    LangChain's abatch path; each caller awaits a future resolved with its
+    slot of the batch response.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        batch_window_ms: float = 10.0,
+        max_batch_size: int = 16
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            llm: Chat model exposing abatch (any LangChain chat model)
+            batch_window_ms: How long to wait for additional requests
+                before submitting a batch
+            max_batch_size: Maximum number of requests per batch
+        """
+        self.llm = llm
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self._queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def ainvoke(self, messages: List[Any]) -> Any:
+        """
+        Submit one request and await its response.
+
+        Args:
+            messages: Messages for a single LLM call
+
+        Returns:
+            The response for this request's slot in the batch
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, future))
+        self._ensure_drain_task()
+        return await future
+
+    def _ensure_drain_task(self):
+        """Start the background drain task if it is not running."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self):
+        """Drain queued requests into batched abatch calls."""
+        while not self._queue.empty():
+            # Short window lets concurrent callers land in the same batch
+            await asyncio.sleep(self.batch_window_ms / 1000.0)
+
+            batch = []
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            if not batch:
+                break
+
+            messages_list = [messages for messages, _ in batch]
+
+            try:
+                responses = await self.llm.abatch(messages_list)
+            except Exception as e:
+                logger.error("LLM batch call failed",
+                            batch_size=len(batch),
+                            error=str(e))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            logger.debug("LLM batch completed", batch_size=len(batch))
+
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
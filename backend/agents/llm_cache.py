@@ -0,0 +1,84 @@
+"""
+LLM response cache for agent reasoning and summarization calls.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+import structlog
+
+logger = structlog.get_logger()
+
+
+class LLMResponseCache:
+    """
+    In-memory LRU cache for LLM responses keyed by prompt content.
+
+    Agents issue near-identical reasoning and summarization prompts for
+    repeated ticker/query pairs; on a cache hit the LLM round-trip is
+    skipped entirely. Keys are content hashes of (agent_type,
+    system_prompt, user_prompt), so a single cache instance can be safely
+    shared across agent instances and agent types.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses before the
+                least recently used entry is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(agent_type: str, system_prompt: str, user_prompt: str) -> str:
+        """Build a cache key from the prompt content."""
+        hasher = hashlib.sha256()
+        for part in (agent_type, system_prompt, user_prompt):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response if present, None otherwise
+        """
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+
+        # Refresh LRU position
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: str, response: str):
+        """
+        Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from make_key
+            response: LLM response content to cache
+        """
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,11 +4,35 @@ News Research Agent - Specializes in gathering recent news and press releases.
 from typing import List
 from langchain_core.language_models import BaseChatModel
 
-from backend.agents.base_agent import BaseResearchAgent
+from backend.agents.base_agent import (
+    BaseResearchAgent,
+    _compile_keyword_pattern,
+    _match_keyword_template
+)
 from backend.tools.base_tool import BaseTool
 from backend.tools.web_search_tool import WebSearchTool
 
 
+# Keyword -> search-query template for news research; matched in one
+# precompiled pass, dict order defines priority when several keywords hit.
+_NEWS_KEYWORD_TEMPLATES = {
+    "earnings": "{ticker} earnings results financial performance Q3 2024",
+    "financial": "{ticker} earnings results financial performance Q3 2024",
+    "analyst": "{ticker} analyst rating upgrade downgrade price target",
+    "rating": "{ticker} analyst rating upgrade downgrade price target",
+    "product": "{ticker} product launch new announcement innovation",
+    "launch": "{ticker} product launch new announcement innovation",
+    "management": "{ticker} management changes CEO executive leadership",
+    "executive": "{ticker} management changes CEO executive leadership",
+    "partnership": "{ticker} partnership acquisition merger deal announcement",
+    "acquisition": "{ticker} partnership acquisition merger deal announcement",
+    "regulatory": "{ticker} regulatory approval FDA SEC compliance news",
+    "compliance": "{ticker} regulatory approval FDA SEC compliance news",
+}
+
+_NEWS_KEYWORD_PATTERN = _compile_keyword_pattern(_NEWS_KEYWORD_TEMPLATES)
+
+
 class NewsAgent(BaseResearchAgent):
     """Agent specialized in gathering recent news and press releases about stocks."""
     
@@ -48,28 +72,15 @@ class NewsAgent(BaseResearchAgent):
         Look for both positive and negative developments to provide balanced coverage.
         """
     
-    async def _act(self, thought: str, context: dict) -> tuple[str, str]:
+    def _pick_query(self, thought_lower: str, ticker: str) -> str:
         """
-        Enhanced action selection for news research.
+        Enhanced search-query selection for news research.
         """
-        thought_lower = thought.lower()
-        ticker = context['ticker']
-        
-        # Customize search queries based on the thought
-        if "earnings" in thought_lower or "financial" in thought_lower:
-            action_input = f"{ticker} earnings results financial performance Q3 2024"
-        elif "analyst" in thought_lower or "rating" in thought_lower:
-            action_input = f"{ticker} analyst rating upgrade downgrade price target"
-        elif "product" in thought_lower or "launch" in thought_lower:
-            action_input = f"{ticker} product launch new announcement innovation"
-        elif "management" in thought_lower or "executive" in thought_lower:
-            action_input = f"{ticker} management changes CEO executive leadership"
-        elif "partnership" in thought_lower or "acquisition" in thought_lower:
-            action_input = f"{ticker} partnership acquisition merger deal announcement"
-        elif "regulatory" in thought_lower or "compliance" in thought_lower:
-            action_input = f"{ticker} regulatory approval FDA SEC compliance news"
-        else:
-            # Default comprehensive news search
-            action_input = f"{ticker} stock news recent developments 2024"
-        
-        return "web_search", action_input
+        template = _match_keyword_template(
+            thought_lower, _NEWS_KEYWORD_PATTERN, _NEWS_KEYWORD_TEMPLATES
+        )
+        if template is not None:
+            return template.format(ticker=ticker)
+
+        # Default comprehensive news search
+        return f"{ticker} stock news recent developments 2024"
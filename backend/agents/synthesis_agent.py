@@ -2,16 +2,21 @@
 Synthesis Agent - Combines research findings into actionable insights and investment stances.
 """
 import asyncio
+import os
+import re
+import weakref
 from datetime import datetime
-from typing import Dict, Any, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from typing import Dict, Any, List, Optional
 import structlog
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from backend.agents.llm_batcher import LLMBatcher
 from backend.app.models import (
-    TickerInsight, 
-    AgentTrace, 
+    TickerInsight,
+    AgentTrace,
     SourceInfo,
     StanceType,
     ConfidenceLevel
@@ -19,15 +24,157 @@ from backend.app.models import (
 
 logger = structlog.get_logger()
 
+# Precompiled once; a single C-level regex pass over the LLM response
+# replaces the per-line startswith/replace scanning the parsers used to do
+_SECTION_RE = re.compile(
+    r'^\s*(SUMMARY|KEY_DRIVERS|RISKS|CATALYSTS|STANCE|CONFIDENCE|RATIONALE):[ \t]*',
+    re.M
+)
+_BULLET_RE = re.compile(r'^\s*-\s+(.*?)\s*$', re.M)
+
+# "Company Name (TICKER)" mentions inside agent observations
+_COMPANY_RE = re.compile(r'([A-Z][A-Za-z&\.\- ]{2,40}?)\s*\(([A-Z]{1,5})\)')
+
+# Cap in-flight synthesis LLM calls process-wide; beyond this the provider
+# rate-limits and the resulting retries cost more than briefly queueing
+_LLM_SEM = asyncio.Semaphore(int(os.getenv("LLM_CONCURRENCY", "8")))
+
+# Stance/confidence lookups; anything unmapped falls back to the
+# conservative default
+_STANCE_MAP = {
+    'buy': StanceType.BUY,
+    'strong buy': StanceType.BUY,
+    'sell': StanceType.SELL,
+    'strong sell': StanceType.SELL,
+    'hold': StanceType.HOLD
+}
+
+_CONFIDENCE_MAP = {
+    'high': ConfidenceLevel.HIGH,
+    'medium': ConfidenceLevel.MEDIUM,
+    'low': ConfidenceLevel.LOW
+}
+
+# Query params that vary per click without changing the document
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'ref', 'fbclid', 'gclid'
+})
+
+
+# Static template parsed once at import; format_map only fills the three
+# placeholders instead of rebuilding the whole prompt string per call
+_INSIGHT_TMPL = """
+Analyze the following research findings for {ticker} and provide a comprehensive assessment with an investment recommendation:
+
+Original Query: {query}
+
+Research Findings:
+{findings}
+
+Please provide a structured analysis in the following format:
+
+SUMMARY:
+[2-3 sentence executive summary of the key findings]
+
+KEY_DRIVERS:
+- [List 3-5 key growth drivers or positive factors]
+
+RISKS:
+- [List 3-5 key risks or negative factors]
+
+CATALYSTS:
+- [List 2-4 upcoming catalysts or events that could impact the stock]
+
+STANCE: [BUY/HOLD/SELL]
+CONFIDENCE: [HIGH/MEDIUM/LOW]
+RATIONALE: [2-3 sentences explaining the reasoning for your stance and confidence level]
+
+Focus on the most material and actionable insights. Be specific and cite key findings.
+Consider the 3-6 month investment horizon and balance the positive drivers against the risks.
+"""
+
+_SYNTHESIS_SYS_PROMPT = """
+You are a senior financial analyst with expertise in equity research, providing stock recommendations for a 3-6 month time horizon.
+Your role is to synthesize research findings from multiple sources into clear, actionable insights and an investment recommendation.
+
+Guidelines:
+- Be objective and balanced in your analysis
+- Focus on material factors that could impact stock performance
+- Prioritize recent and credible information
+- Consider both fundamental and technical factors
+- Be specific and avoid generic statements
+- Cite key findings when making assertions
+
+Guidelines for recommendations:
+- BUY: Strong positive catalysts, limited downside risk, compelling risk/reward
+- HOLD: Balanced outlook, fair valuation, mixed signals
+- SELL: Significant risks, negative catalysts, poor risk/reward
+
+Confidence levels:
+- HIGH: Strong conviction based on multiple confirming factors
+- MEDIUM: Reasonable conviction with some uncertainty
+- LOW: Limited conviction due to conflicting signals or insufficient data
+
+Be conservative and realistic in your assessments.
+"""
+
+# SystemMessage is immutable, so one shared instance serves every call
+# instead of re-validating the same prompt per synthesis
+_SYNTHESIS_SYS_MSG = SystemMessage(content=_SYNTHESIS_SYS_PROMPT)
+
+
+def _canonical_url(url: str) -> str:
+    """Canonicalize a URL for deduplication.
+
+    Lowercases the scheme and host, strips trailing slashes and tracking
+    query params, and drops fragments, so e.g. https://x.com/a and
+    https://X.com/a/?utm_source=feed dedupe to one source.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query)
+        if key.lower() not in _TRACKING_PARAMS
+    ])
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, '')
+    )
+
+# One batcher per chat model, shared across SynthesisAgent instances and
+# therefore across concurrent /analyze requests: simultaneous per-ticker
+# synthesis prompts coalesce into single abatch calls instead of issuing
+# one HTTP round trip each. Values are weak so an entry lives exactly as
+# long as some agent holds its batcher; the batcher's strong reference to
+# the llm keeps the id key from being reused while the entry exists.
+_SHARED_BATCHERS: "weakref.WeakValueDictionary[int, LLMBatcher]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_shared_batcher(llm: BaseChatModel) -> LLMBatcher:
+    """Get the process-wide batcher for an LLM, creating it on first use."""
+    batcher = _SHARED_BATCHERS.get(id(llm))
+    if batcher is None:
+        batcher = LLMBatcher(llm)
+        _SHARED_BATCHERS[id(llm)] = batcher
+    return batcher
+
 
 class SynthesisAgent:
     """
     Agent responsible for synthesizing research findings from all agents
     into actionable insights and investment recommendations.
     """
-    
-    def __init__(self, llm: BaseChatModel):
+
+    def __init__(self, llm: BaseChatModel, batcher: Optional[LLMBatcher] = None):
         self.llm = llm
+        # Default to the process-wide batcher so every agent on the same
+        # model coalesces concurrent synthesis calls without opting in
+        self.batcher = batcher or get_shared_batcher(llm)
     
     async def synthesize(
         self, 
@@ -47,34 +194,36 @@ class SynthesisAgent:
             TickerInsight with comprehensive analysis and recommendation
         """
         logger.info("Synthesizing insights", ticker=ticker)
-        
+
+        # One clock read serves both the happy path and the error fallback
+        now = datetime.now()
+
         try:
-            # Extract all findings and sources
-            all_findings = self._extract_findings(agent_results)
-            all_sources = self._extract_sources(agent_results)
-            agent_traces = self._extract_traces(agent_results)
-            
-            # Generate comprehensive analysis
-            analysis = await self._generate_analysis(ticker, all_findings, query)
-            
+            # Extract findings, sources and traces in one pass
+            all_findings, finding_agents, all_sources, agent_traces = self._extract_all(agent_results)
+
+            # Generate analysis and recommendation in one LLM round trip
+            insight_data = await self._generate_full_insight(
+                ticker, all_findings, finding_agents, query
+            )
+
             # Extract structured insights
-            summary = analysis.get("summary", "")
-            key_drivers = analysis.get("key_drivers", [])
-            risks = analysis.get("risks", [])
-            catalysts = analysis.get("catalysts", [])
-            
-            # Generate investment recommendation
-            recommendation = await self._generate_recommendation(ticker, analysis, all_findings)
-            
-            stance = self._parse_stance(recommendation.get("stance", "hold"))
-            confidence = self._parse_confidence(recommendation.get("confidence", "medium"))
-            rationale = recommendation.get("rationale", "")
+            summary = insight_data.get("summary", "")
+            key_drivers = insight_data.get("key_drivers", [])
+            risks = insight_data.get("risks", [])
+            catalysts = insight_data.get("catalysts", [])
+
+            stance = self._parse_stance(insight_data.get("stance", "hold"))
+            confidence = self._parse_confidence(insight_data.get("confidence", "medium"))
+            rationale = insight_data.get("rationale", "")
             
             # Get company name if available
             company_name = self._extract_company_name(all_findings)
             
-            # Create the insight
-            insight = TickerInsight(
+            # Create the insight; every field is produced in-process with
+            # the right types (enums parsed, sources/traces already models),
+            # so model_construct skips the per-field validator dispatch
+            insight = TickerInsight.model_construct(
                 ticker=ticker,
                 company_name=company_name,
                 summary=summary,
@@ -86,10 +235,10 @@ class SynthesisAgent:
                 rationale=rationale,
                 sources=all_sources,
                 agent_traces=agent_traces,
-                analysis_timestamp=datetime.now()
+                analysis_timestamp=now
             )
-            
-            logger.info("Synthesis completed", 
+
+            logger.info("Synthesis completed",
                        ticker=ticker,
                        stance=stance.value,
                        confidence=confidence.value)
@@ -100,7 +249,7 @@ class SynthesisAgent:
             logger.error("Synthesis failed", ticker=ticker, error=str(e))
             
             # Return a basic insight with error information
-            return TickerInsight(
+            return TickerInsight.model_construct(
                 ticker=ticker,
                 summary=f"Analysis failed: {str(e)}",
                 key_drivers=[],
@@ -111,270 +260,196 @@ class SynthesisAgent:
                 rationale="Unable to complete analysis due to technical issues",
                 sources=[],
                 agent_traces=[],
-                analysis_timestamp=datetime.now()
+                analysis_timestamp=now
             )
     
-    def _extract_findings(self, agent_results: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Extract all findings from agent results."""
-        all_findings = []
-        
-        for agent_name, result in agent_results.items():
-            if "error" in result:
-                continue
-                
-            findings = result.get("findings", [])
-            for finding in findings:
-                finding["agent"] = agent_name
-                all_findings.append(finding)
-        
-        return all_findings
-    
-    def _extract_sources(self, agent_results: Dict[str, Dict[str, Any]]) -> List[SourceInfo]:
-        """Extract all sources from agent results."""
-        all_sources = []
-        seen_urls = set()
-        
-        for agent_name, result in agent_results.items():
-            if "error" in result:
-                continue
-                
-            sources = result.get("sources", [])
-            for source_data in sources:
-                if isinstance(source_data, dict):
-                    url = source_data.get("url", "")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        source = SourceInfo(
-                            url=url,
-                            title=source_data.get("title"),
-                            published_at=source_data.get("published_at"),
-                            snippet=source_data.get("snippet")
-                        )
-                        all_sources.append(source)
-        
-        return all_sources
-    
-    def _extract_traces(self, agent_results: Dict[str, Dict[str, Any]]) -> List[AgentTrace]:
-        """Extract agent execution traces."""
-        traces = []
-        
+    def _extract_all(
+        self,
+        agent_results: Dict[str, Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], List[str], List[SourceInfo], List[AgentTrace]]:
+        """Extract findings, deduplicated sources and traces in one pass.
+
+        agent_results used to be iterated three times by separate helpers,
+        each repeating the error check; one fused loop populates the output
+        lists. Finding dicts are left untouched — the owning agent names are
+        returned as a parallel list instead of being written into each dict,
+        so the findings stay shareable and the extraction is retry-safe.
+        """
+        findings: List[Dict[str, Any]] = []
+        agents: List[str] = []
+        seen: Dict[str, SourceInfo] = {}
+        traces: List[AgentTrace] = []
+
         for agent_name, result in agent_results.items():
             trace_data = result.get("trace")
             if trace_data and isinstance(trace_data, AgentTrace):
                 traces.append(trace_data)
-        
-        return traces
+
+            if "error" in result:
+                continue
+
+            # Truthiness check skips agents with empty results entirely, and
+            # one extend beats N appends
+            agent_findings = result.get("findings")
+            if agent_findings:
+                findings.extend(agent_findings)
+                agents.extend([agent_name] * len(agent_findings))
+
+            # Deduplicate sources by canonical URL
+            for source_data in result.get("sources", ()):
+                if not isinstance(source_data, dict):
+                    continue
+                url = source_data.get("url")
+                if not url:
+                    continue
+                key = _canonical_url(url)
+                if key in seen:
+                    continue
+                seen[key] = SourceInfo(
+                    url=url,
+                    title=source_data.get("title"),
+                    published_at=source_data.get("published_at"),
+                    snippet=source_data.get("snippet")
+                )
+
+        return findings, agents, list(seen.values()), traces
     
-    async def _generate_analysis(
-        self, 
-        ticker: str, 
-        findings: List[Dict[str, Any]], 
+    async def _generate_full_insight(
+        self,
+        ticker: str,
+        findings: List[Dict[str, Any]],
+        finding_agents: List[str],
         query: str
     ) -> Dict[str, Any]:
-        """Generate comprehensive analysis from all findings."""
-        
-        # Prepare findings summary
-        findings_text = self._format_findings_for_analysis(findings)
-        
-        analysis_prompt = f"""
-        Analyze the following research findings for {ticker} and provide a comprehensive assessment:
-        
-        Original Query: {query}
-        
-        Research Findings:
-        {findings_text}
-        
-        Please provide a structured analysis in the following format:
-        
-        SUMMARY:
-        [2-3 sentence executive summary of the key findings]
-        
-        KEY_DRIVERS:
-        - [List 3-5 key growth drivers or positive factors]
-        
-        RISKS:
-        - [List 3-5 key risks or negative factors]
-        
-        CATALYSTS:
-        - [List 2-4 upcoming catalysts or events that could impact the stock]
-        
-        Focus on the most material and actionable insights. Be specific and cite key findings.
+        """Generate the full analysis and recommendation in a single LLM call.
+
+        The model already has all findings in context when it writes the
+        analysis, so asking for the stance in the same response halves the
+        LLM round trips per ticker versus separate analysis and
+        recommendation calls.
         """
-        
+
+        # Prepare findings summary
+        findings_text = self._format_findings_for_analysis(findings, finding_agents)
+
+        insight_prompt = _INSIGHT_TMPL.format_map({
+            "ticker": ticker,
+            "query": query,
+            "findings": findings_text
+        })
+
         messages = [
-            SystemMessage(content=self._get_analysis_system_prompt()),
-            HumanMessage(content=analysis_prompt)
+            _SYNTHESIS_SYS_MSG,
+            HumanMessage(content=insight_prompt)
         ]
-        
-        response = await self.llm.ainvoke(messages)
-        return self._parse_analysis_response(response.content)
+
+        async with _LLM_SEM:
+            # Brief exponential backoff on rate-limit errors; anything else
+            # propagates to synthesize()'s fallback path
+            for attempt in range(3):
+                try:
+                    if self.batcher is not None:
+                        response = await self.batcher.ainvoke(messages)
+                    else:
+                        response = await self.llm.ainvoke(messages)
+                    break
+                except Exception as e:
+                    if '429' not in str(e) or attempt == 2:
+                        raise
+                    logger.warning("LLM rate limited, retrying",
+                                   ticker=ticker,
+                                   attempt=attempt + 1)
+                    await asyncio.sleep(0.5 * (2 ** attempt))
+        # The two parsers pick out disjoint sections of the same response
+        return {
+            **self._parse_analysis_response(response.content),
+            **self._parse_recommendation_response(response.content)
+        }
     
-    async def _generate_recommendation(
-        self, 
-        ticker: str, 
-        analysis: Dict[str, Any], 
-        findings: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """Generate investment recommendation and stance."""
-        
-        recommendation_prompt = f"""
-        Based on the following analysis for {ticker}, provide an investment recommendation:
-        
-        Summary: {analysis.get('summary', '')}
-        Key Drivers: {', '.join(analysis.get('key_drivers', []))}
-        Risks: {', '.join(analysis.get('risks', []))}
-        Catalysts: {', '.join(analysis.get('catalysts', []))}
-        
-        Provide your recommendation in the following format:
-        
-        STANCE: [BUY/HOLD/SELL]
-        CONFIDENCE: [HIGH/MEDIUM/LOW]
-        RATIONALE: [2-3 sentences explaining the reasoning for your stance and confidence level]
-        
-        Consider the 3-6 month investment horizon and balance the positive drivers against the risks.
+    def _format_findings_for_analysis(
+        self,
+        findings: List[Dict[str, Any]],
+        finding_agents: List[str]
+    ) -> str:
+        """Format findings for the analysis prompt.
+
+        finding_agents is the parallel agent-name list emitted by
+        _extract_all; zipping it keeps the finding dicts untouched.
         """
-        
-        messages = [
-            SystemMessage(content=self._get_recommendation_system_prompt()),
-            HumanMessage(content=recommendation_prompt)
-        ]
-        
-        response = await self.llm.ainvoke(messages)
-        return self._parse_recommendation_response(response.content)
-    
-    def _format_findings_for_analysis(self, findings: List[Dict[str, Any]]) -> str:
-        """Format findings for analysis prompt."""
         if not findings:
             return "No significant findings available."
-        
-        formatted = []
-        for finding in findings:
-            agent = finding.get("agent", "unknown")
-            observation = finding.get("observation", "")
-            formatted.append(f"[{agent.upper()}] {observation}")
-        
-        return "\n".join(formatted)
-    
-    def _get_analysis_system_prompt(self) -> str:
-        """Get system prompt for analysis generation."""
-        return """
-        You are a senior financial analyst with expertise in equity research and investment analysis.
-        Your role is to synthesize research findings from multiple sources into clear, actionable insights.
-        
-        Guidelines:
-        - Be objective and balanced in your analysis
-        - Focus on material factors that could impact stock performance
-        - Prioritize recent and credible information
-        - Consider both fundamental and technical factors
-        - Be specific and avoid generic statements
-        - Cite key findings when making assertions
-        """
+
+        # Findings repeat the same handful of agent names; uppercase each
+        # name once instead of per finding, and feed join a generator so no
+        # intermediate list is built
+        upper_cache: Dict[str, str] = {}
+
+        def _upper(agent: str) -> str:
+            cached = upper_cache.get(agent)
+            if cached is None:
+                cached = upper_cache[agent] = agent.upper()
+            return cached
+
+        return "\n".join(
+            f"[{_upper(agent)}] {finding.get('observation', '')}"
+            for agent, finding in zip(finding_agents, findings)
+        )
     
-    def _get_recommendation_system_prompt(self) -> str:
-        """Get system prompt for recommendation generation."""
-        return """
-        You are an investment analyst providing stock recommendations for a 3-6 month time horizon.
-        
-        Guidelines for recommendations:
-        - BUY: Strong positive catalysts, limited downside risk, compelling risk/reward
-        - HOLD: Balanced outlook, fair valuation, mixed signals
-        - SELL: Significant risks, negative catalysts, poor risk/reward
-        
-        Confidence levels:
-        - HIGH: Strong conviction based on multiple confirming factors
-        - MEDIUM: Reasonable conviction with some uncertainty
-        - LOW: Limited conviction due to conflicting signals or insufficient data
-        
-        Be conservative and realistic in your assessments.
+    def _split_sections(self, response: str) -> Dict[str, str]:
+        """Split an LLM response into section-name -> raw-body slices.
+
+        One finditer pass locates the section headers; each body is the
+        slice between consecutive header spans.
         """
-    
+        sections = {}
+        matches = list(_SECTION_RE.finditer(response))
+
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+            name = match.group(1).lower()
+            if name not in sections:
+                sections[name] = response[match.end():end].strip()
+
+        return sections
+
     def _parse_analysis_response(self, response: str) -> Dict[str, Any]:
         """Parse the structured analysis response."""
-        analysis = {
-            "summary": "",
-            "key_drivers": [],
-            "risks": [],
-            "catalysts": []
+        sections = self._split_sections(response)
+
+        return {
+            "summary": ' '.join(sections.get("summary", "").split()),
+            "key_drivers": _BULLET_RE.findall(sections.get("key_drivers", "")),
+            "risks": _BULLET_RE.findall(sections.get("risks", "")),
+            "catalysts": _BULLET_RE.findall(sections.get("catalysts", ""))
         }
-        
-        current_section = None
-        lines = response.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('SUMMARY:'):
-                current_section = 'summary'
-                analysis['summary'] = line.replace('SUMMARY:', '').strip()
-            elif line.startswith('KEY_DRIVERS:'):
-                current_section = 'key_drivers'
-            elif line.startswith('RISKS:'):
-                current_section = 'risks'
-            elif line.startswith('CATALYSTS:'):
-                current_section = 'catalysts'
-            elif line.startswith('- ') and current_section in ['key_drivers', 'risks', 'catalysts']:
-                item = line.replace('- ', '').strip()
-                analysis[current_section].append(item)
-            elif current_section == 'summary' and not line.startswith(('KEY_DRIVERS:', 'RISKS:', 'CATALYSTS:')):
-                analysis['summary'] += ' ' + line
-        
-        return analysis
-    
+
     def _parse_recommendation_response(self, response: str) -> Dict[str, Any]:
         """Parse the recommendation response."""
-        recommendation = {
-            "stance": "hold",
-            "confidence": "medium",
-            "rationale": ""
+        sections = self._split_sections(response)
+
+        return {
+            "stance": sections.get("stance", "").lower() or "hold",
+            "confidence": sections.get("confidence", "").lower() or "medium",
+            "rationale": ' '.join(sections.get("rationale", "").split())
         }
-        
-        lines = response.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('STANCE:'):
-                stance = line.replace('STANCE:', '').strip().lower()
-                recommendation['stance'] = stance
-            elif line.startswith('CONFIDENCE:'):
-                confidence = line.replace('CONFIDENCE:', '').strip().lower()
-                recommendation['confidence'] = confidence
-            elif line.startswith('RATIONALE:'):
-                rationale = line.replace('RATIONALE:', '').strip()
-                recommendation['rationale'] = rationale
-        
-        return recommendation
     
     def _parse_stance(self, stance_str: str) -> StanceType:
         """Parse stance string to StanceType enum."""
-        stance_str = stance_str.lower().strip()
-        
-        if stance_str in ['buy', 'strong buy']:
-            return StanceType.BUY
-        elif stance_str in ['sell', 'strong sell']:
-            return StanceType.SELL
-        else:
-            return StanceType.HOLD
-    
+        return _STANCE_MAP.get(stance_str.lower().strip(), StanceType.HOLD)
+
     def _parse_confidence(self, confidence_str: str) -> ConfidenceLevel:
         """Parse confidence string to ConfidenceLevel enum."""
-        confidence_str = confidence_str.lower().strip()
-        
-        if confidence_str == 'high':
-            return ConfidenceLevel.HIGH
-        elif confidence_str == 'low':
-            return ConfidenceLevel.LOW
-        else:
-            return ConfidenceLevel.MEDIUM
+        return _CONFIDENCE_MAP.get(confidence_str.lower().strip(), ConfidenceLevel.MEDIUM)
     
-    def _extract_company_name(self, findings: List[Dict[str, Any]]) -> str:
-        """Extract company name from findings if available."""
-        # Simple extraction - in a real implementation, you'd use more sophisticated methods
+    def _extract_company_name(self, findings: List[Dict[str, Any]]) -> Optional[str]:
+        """Extract company name from findings if available.
+
+        Returns the first "Company Name (TICKER)" mention found in the
+        observations, or None.
+        """
         for finding in findings:
-            observation = finding.get("observation", "")
-            # Look for patterns like "Company Name (TICKER)" or "TICKER Company"
-            # This is a simplified approach
-            pass
-        
+            match = _COMPANY_RE.search(finding.get("observation", ""))
+            if match:
+                return match.group(1).strip()
+
         return None
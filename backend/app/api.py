@@ -2,18 +2,22 @@
 API routes for the Stock Research Chatbot.
 Enhanced with professional user-facing streaming logs and multi-correction support.
 """
+import asyncio
+import re
+import threading
 import uuid
 import time
 from datetime import datetime
 from typing import Dict, Any, List
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from backend.app.models import (
-    AnalysisRequest, 
-    AnalysisResponse, 
+    AnalysisRequest,
+    AnalysisResponse,
     AnalysisStatus,
     TickerInsight,
     StanceType,
@@ -21,24 +25,29 @@ from backend.app.models import (
     CorrectionSuggestion,
     ConfirmationPrompt
 )
-from backend.agents.orchestrator import Orchestrator
-from backend.config.settings import get_settings
-from backend.services.ticker_mapper import get_ticker_mapper
-from backend.services.conversation_manager import get_conversation_manager
-from backend.services.smart_correction_service import get_smart_correction_service
-from backend.services.log_broadcaster import create_log_broadcaster
-from backend.app.websocket import get_connection_manager
-from backend.utils.formatters import format_analysis_response
+
+# The orchestrator stack (LangGraph, Gemini, Yahoo tooling) and supporting
+# services are imported lazily inside analyze_stocks: workers that only ever
+# serve /health or /status skip the whole dependency tree at cold start, and
+# the first /analyze call pays it once (module imports are cached after that).
 
 logger = structlog.get_logger()
-router = APIRouter()
+# orjson encodes the nested multi-ticker AnalysisResponse payloads several
+# times faster than the default json-based response class
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# In-memory storage for analysis status (in production, use Redis or similar).
+# TTL-bounded so entries for finished requests expire instead of growing RSS
+# without limit; cachetools caches are not thread-safe, hence the lock.
+analysis_status_store: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_status_store_lock = threading.Lock()
 
-# In-memory storage for analysis status (in production, use Redis or similar)
-analysis_status_store: Dict[str, Dict[str, Any]] = {}
+# Candidate ticker tokens: 1-5 uppercase letters
+_TICKER_RE = re.compile(r'\b[A-Z]{1,5}\b')
 
 
 @router.post("/analyze", response_model=AnalysisResponse)
-async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
+async def analyze_stocks(request: AnalysisRequest):
     """
     Analyze stocks based on natural language query.
     
@@ -51,10 +60,18 @@ async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
     start_time = time.time()
     started_at = datetime.now()
     
-    logger.info("Starting stock analysis", 
-                request_id=request_id, 
+    logger.info("Starting stock analysis",
+                request_id=request_id,
                 query=request.query)
-    
+
+    from backend.agents.orchestrator import Orchestrator
+    from backend.services.ticker_mapper import get_ticker_mapper
+    from backend.services.conversation_manager import get_conversation_manager
+    from backend.services.smart_correction_service import get_smart_correction_service
+    from backend.services.log_broadcaster import create_log_broadcaster
+    from backend.app.websocket import get_connection_manager
+    from backend.utils.formatters import format_analysis_response
+
     try:
         # Create log broadcaster early for pre-confirmation logging
         connection_manager = get_connection_manager()
@@ -125,15 +142,41 @@ async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
         if not request.conversation_id or not request.confirmation_response:
             # Emit log: analyzing query
             await log_broadcaster.extracting_tickers()
-            
+
+            # Queries that already spell out known uppercase tickers (e.g.
+            # "Analyze AAPL and MSFT") are unambiguous; skip the Gemini
+            # spell-check round trip for them. Local extraction is pure
+            # Python and still runs, so mixed queries like "Compare AAPL
+            # and Microsoft" keep their company names.
+            known_tickers = [
+                token for token in dict.fromkeys(_TICKER_RE.findall(request.query))
+                if token in ticker_mapper.ticker_to_company
+            ]
+            if known_tickers:
+                extracted, unresolved_names = ticker_mapper.extract_tickers_from_query(request.query)
+                tickers = list(dict.fromkeys(known_tickers + extracted))
+                logger.info("Query names known tickers, skipping smart correction",
+                           tickers=tickers)
+                await log_broadcaster.tickers_found(tickers)
+
             # First, try smart correction with Gemini (supports MULTIPLE corrections)
-            if smart_correction_service:
+            elif smart_correction_service:
+                # Kick off the blocking Gemini correction call in a worker
+                # thread so it overlaps with the log broadcast below instead
+                # of stalling the event loop
+                correction_task = asyncio.create_task(
+                    asyncio.to_thread(
+                        smart_correction_service.detect_and_correct_multiple,
+                        request.query
+                    )
+                )
+
                 # Emit log: checking for typos
                 await log_broadcaster.checking_typos()
-                
+
                 try:
-                    correction_result = smart_correction_service.detect_and_correct_multiple(request.query)
-                    
+                    correction_result = await correction_task
+
                     if correction_result.get('has_misspellings') and correction_result.get('corrections'):
                         corrections = correction_result.get('corrections', [])
                         
@@ -152,17 +195,16 @@ async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
                             first_correction = corrections[0]
                             confirmation_message = f"Did you mean **{first_correction['corrected_name']}** ({first_correction['ticker']})?"
                         else:
-                            # Multiple corrections - show all at once
-                            corrections_list = []
-                            for i, corr in enumerate(corrections, 1):
-                                corrections_list.append(
+                            # Multiple corrections - show all at once; join
+                            # over a generator builds the list body without
+                            # intermediate list/concat allocations
+                            confirmation_message = (
+                                f"I found {len(corrections)} potential misspellings:\n\n"
+                                + "\n".join(
                                     f"{i}. '{corr['original']}' → **{corr['corrected_name']}** ({corr['ticker']})"
+                                    for i, corr in enumerate(corrections, 1)
                                 )
-                            
-                            confirmation_message = (
-                                f"I found {len(corrections)} potential misspellings:\n\n" +
-                                "\n".join(corrections_list) +
-                                "\n\nDid you mean these corrections?"
+                                + "\n\nDid you mean these corrections?"
                             )
                         
                         logger.info("Smart correction detected misspellings - presenting ALL at once",
@@ -186,8 +228,8 @@ async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
                                 message=confirmation_message,
                                 suggestion=CorrectionSuggestion(
                                     original_input=request.query,
-                                    corrected_name=", ".join([c['corrected_name'] for c in corrections]),
-                                    ticker=", ".join([c['ticker'] for c in corrections]),
+                                    corrected_name=", ".join(c['corrected_name'] for c in corrections),
+                                    ticker=", ".join(c['ticker'] for c in corrections),
                                     confidence=corrections[0].get('confidence', 'medium'),
                                     explanation=f"Found {len(corrections)} potential misspelling(s)"
                                 ),
@@ -241,11 +283,17 @@ async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
             total_latency_ms=(time.time() - start_time) * 1000
         )
         
-        logger.info("Stock analysis completed", 
+        logger.info("Stock analysis completed",
                    request_id=request_id,
                    tickers_count=len(results))
-        
-        return response
+
+        # The full insight payload nests hundreds of trace/step/source
+        # objects; pydantic-core's model_dump_json serializes the tree in one
+        # Rust pass, and returning a Response skips FastAPI's re-validation
+        # and jsonable_encoder walk. The small confirmation-prompt returns
+        # above keep the normal response_model path.
+        return Response(content=response.model_dump_json(),
+                        media_type="application/json")
         
     except HTTPException:
         raise
@@ -267,10 +315,13 @@ async def analyze_stocks(request: AnalysisRequest) -> AnalysisResponse:
 @router.get("/status/{request_id}")
 async def get_analysis_status(request_id: str) -> Dict[str, Any]:
     """Get the status of an analysis request."""
-    if request_id not in analysis_status_store:
+    with _status_store_lock:
+        status = analysis_status_store.get(request_id)
+
+    if status is None:
         raise HTTPException(status_code=404, detail="Request not found")
-    
-    return analysis_status_store[request_id]
+
+    return status
 
 
 @router.get("/health")
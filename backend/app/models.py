@@ -2,10 +2,10 @@
 Pydantic models for API requests and responses.
 """
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StanceType(str, Enum):
@@ -24,21 +24,28 @@ class ConfidenceLevel(str, Enum):
 
 class SourceInfo(BaseModel):
     """Information about a data source."""
+    # Immutable value object: built in bulk during agent execution and never
+    # mutated afterwards, so freezing makes instances safely shareable
+    # across ticker insights
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     url: str = Field(..., description="Source URL")
     title: Optional[str] = Field(None, description="Source title")
     published_at: Optional[datetime] = Field(None, description="Publication date")
-    fetched_at: datetime = Field(default_factory=datetime.now, description="Fetch timestamp")
+    fetched_at: datetime = Field(default_factory=datetime.utcnow, description="Fetch timestamp")
     snippet: Optional[str] = Field(None, description="Relevant snippet from source")
 
 
 class AgentStep(BaseModel):
     """A single step in an agent's ReAct loop."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     step_number: int = Field(..., description="Step number in the sequence")
     thought: str = Field(..., description="Agent's reasoning")
     action: str = Field(..., description="Action taken")
     observation: str = Field(..., description="Result of the action")
     sources: List[SourceInfo] = Field(default_factory=list, description="Sources used in this step")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Step timestamp")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Step timestamp")
     latency_ms: Optional[float] = Field(None, description="Step execution time in milliseconds")
 
 
@@ -76,8 +83,12 @@ class TickerInsight(BaseModel):
     catalysts: List[str] = Field(default_factory=list, description="Upcoming catalysts")
     
     # Investment recommendation
-    stance: StanceType = Field(..., description="Investment stance")
-    confidence: ConfidenceLevel = Field(..., description="Confidence level")
+    # Literal fields validate as a direct Rust-side string-set check and skip
+    # the enum member lookup per construction; StanceType/ConfidenceLevel
+    # remain the public constants used at call sites (str-enum members
+    # compare equal to these literals)
+    stance: Literal["hold", "buy", "sell"] = Field(..., description="Investment stance")
+    confidence: Literal["low", "medium", "high"] = Field(..., description="Confidence level")
     rationale: str = Field(..., description="Reasoning for the stance")
     
     # Supporting data
@@ -85,7 +96,7 @@ class TickerInsight(BaseModel):
     agent_traces: List[AgentTrace] = Field(default_factory=list, description="Agent execution traces")
     
     # Metadata
-    analysis_timestamp: datetime = Field(default_factory=datetime.now, description="Analysis completion time")
+    analysis_timestamp: datetime = Field(default_factory=datetime.utcnow, description="Analysis completion time")
 
 
 class AnalysisRequest(BaseModel):
@@ -145,6 +156,8 @@ class AnalysisResponse(BaseModel):
 
 class AnalysisStatus(BaseModel):
     """Status model for ongoing analysis."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     request_id: str = Field(..., description="Request identifier")
     status: str = Field(..., description="Current status")
     progress: float = Field(..., description="Progress percentage (0-100)")
@@ -1,15 +1,19 @@
 """
 WebSocket connection manager for streaming logs.
 """
-import json
 import asyncio
-from typing import Dict, Set, Any
+from typing import Dict, Any
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
+import orjson
 import structlog
 
 logger = structlog.get_logger()
 
+# orjson serializes datetimes natively; these options stamp naive datetimes
+# as UTC with a trailing "Z", matching the old isoformat()+"Z" convention
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
 
 class ConnectionManager:
     """
@@ -18,99 +22,116 @@ class ConnectionManager:
     """
     
     def __init__(self):
-        # Map of request_id -> set of WebSocket connections
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
-        self._lock = asyncio.Lock()
-    
+        # Map of request_id -> immutable tuple of WebSocket connections.
+        # Copy-on-write: the tuple is only rebuilt on connect/disconnect, so
+        # the hot broadcast path reads a consistent snapshot with no copying
+        # per message. Each rebuild is a single read-modify-assign with no
+        # await in between, which one asyncio task step executes atomically —
+        # no lock needed on a single-threaded event loop.
+        self.active_connections: Dict[str, tuple] = {}
+
     async def connect(self, websocket: WebSocket, request_id: str):
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        
-        async with self._lock:
-            if request_id not in self.active_connections:
-                self.active_connections[request_id] = set()
-            self.active_connections[request_id].add(websocket)
-        
-        logger.info("WebSocket connected", 
+
+        self.active_connections[request_id] = (
+            self.active_connections.get(request_id, ()) + (websocket,)
+        )
+
+        logger.info("WebSocket connected",
                    request_id=request_id,
                    total_connections=len(self.active_connections[request_id]))
-    
+
     async def disconnect(self, websocket: WebSocket, request_id: str):
         """Remove a WebSocket connection."""
-        async with self._lock:
-            if request_id in self.active_connections:
-                self.active_connections[request_id].discard(websocket)
-                
-                # Clean up empty sets
-                if not self.active_connections[request_id]:
-                    del self.active_connections[request_id]
-        
-        logger.info("WebSocket disconnected", 
+        remaining = tuple(
+            conn for conn in self.active_connections.get(request_id, ())
+            if conn is not websocket
+        )
+        if remaining:
+            self.active_connections[request_id] = remaining
+        else:
+            # Clean up empty entries
+            self.active_connections.pop(request_id, None)
+
+        logger.info("WebSocket disconnected",
                    request_id=request_id,
-                   remaining_connections=len(self.active_connections.get(request_id, [])))
+                   remaining_connections=len(self.active_connections.get(request_id, ())))
     
     async def broadcast(self, request_id: str, message: Dict[str, Any]):
         """
         Broadcast a message to all connections for a specific request_id.
-        
+
+        Messages go out as binary frames carrying UTF-8 JSON, encoded once
+        per broadcast; clients must decode the bytes before parsing (the
+        frontend hook sets binaryType and runs them through TextDecoder).
+
         Args:
             request_id: The request ID to broadcast to
             message: The message dictionary to send
         """
-        if request_id not in self.active_connections:
+        # The snapshot tuple is immutable, so iterating it is safe even if
+        # connections churn mid-broadcast — no per-message copy needed
+        connections = self.active_connections.get(request_id)
+        if not connections:
             return
-        
-        # Add timestamp if not present
+
+        # Add timestamp if not present; orjson renders the datetime directly
         if "timestamp" not in message:
-            message["timestamp"] = datetime.utcnow().isoformat() + "Z"
-        
-        message_json = json.dumps(message)
-        
-        # Get a copy of connections to avoid modification during iteration
-        connections = list(self.active_connections[request_id])
-        
+            message["timestamp"] = datetime.utcnow()
+
+        # Encode once, outside the fan-out loop
+        payload = orjson.dumps(message, option=_ORJSON_OPTS)
+
+        # Send to all subscribers concurrently: a slow client no longer
+        # blocks the rest, so broadcast latency is max(sends), not sum(sends)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True
+        )
+
         disconnected = []
-        for connection in connections:
-            try:
-                await connection.send_text(message_json)
-            except WebSocketDisconnect:
+        for connection, result in zip(connections, results):
+            if isinstance(result, WebSocketDisconnect):
                 disconnected.append(connection)
-            except Exception as e:
-                logger.error("Error broadcasting message", 
+            elif isinstance(result, Exception):
+                logger.error("Error broadcasting message",
                            request_id=request_id,
-                           error=str(e))
+                           error=str(result))
                 disconnected.append(connection)
-        
-        # Clean up disconnected connections
+
+        # Clean up disconnected connections with one snapshot-and-swap;
+        # re-read the current tuple since clients may have joined mid-send
         if disconnected:
-            async with self._lock:
-                for conn in disconnected:
-                    self.active_connections[request_id].discard(conn)
-                
-                if not self.active_connections[request_id]:
-                    del self.active_connections[request_id]
+            remaining = tuple(
+                conn for conn in self.active_connections.get(request_id, ())
+                if conn not in disconnected
+            )
+            if remaining:
+                self.active_connections[request_id] = remaining
+            else:
+                self.active_connections.pop(request_id, None)
     
     async def send_personal_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send a message to a specific WebSocket connection."""
         if "timestamp" not in message:
-            message["timestamp"] = datetime.utcnow().isoformat() + "Z"
-        
+            message["timestamp"] = datetime.utcnow()
+
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_bytes(orjson.dumps(message, option=_ORJSON_OPTS))
         except Exception as e:
             logger.error("Error sending personal message", error=str(e))
     
     def get_connection_count(self, request_id: str) -> int:
         """Get the number of active connections for a request_id."""
-        return len(self.active_connections.get(request_id, set()))
-    
+        return len(self.active_connections.get(request_id, ()))
+
     async def close_all(self, request_id: str):
         """Close all connections for a specific request_id."""
-        if request_id not in self.active_connections:
+        connections = self.active_connections.get(request_id)
+        if not connections:
             return
-        
-        connections = list(self.active_connections[request_id])
-        
+
         for connection in connections:
             try:
                 await connection.close()
@@ -119,9 +140,7 @@ class ConnectionManager:
                            request_id=request_id,
                            error=str(e))
         
-        async with self._lock:
-            if request_id in self.active_connections:
-                del self.active_connections[request_id]
+        self.active_connections.pop(request_id, None)
 
 
 # Global connection manager instance
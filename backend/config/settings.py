@@ -2,7 +2,8 @@
 Configuration settings for the Stock Research Chatbot.
 """
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,6 +18,7 @@ class Settings(BaseSettings):
     
     # Agent Configuration
     max_iterations: int = 3
+    max_concurrent_tickers: int = 8
     request_timeout: int = 30
     rate_limit_requests_per_minute: int = 60
     
@@ -26,6 +28,9 @@ class Settings(BaseSettings):
     # API Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
+    cors_origins: List[str] = ["http://localhost:3000"]
+    # Uvicorn worker processes; 2*CPU+1 is the usual production sizing
+    workers: int = 1
     
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding='utf-8', case_sensitive=False, extra='ignore')
 
@@ -34,7 +39,16 @@ class Settings(BaseSettings):
 # Global settings instance
 settings = Settings()
 
+# Derived values used by the uvicorn entrypoint, computed once at import
+RELOAD_FLAG = settings.app_env == "development"
+LOG_LEVEL_LOWER = settings.log_level.lower()
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the application settings."""
+    """Get the application settings.
+
+    Cached so per-request callers can never accidentally re-run the
+    pydantic-settings env-var walk by instantiating a fresh Settings.
+    """
     return settings
@@ -1,13 +1,98 @@
 """
 Conversation Manager - Handles interactive confirmations and conversation state.
 """
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import heapq
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
 from enum import Enum
+from cachetools import TTLCache
 import structlog
 
 logger = structlog.get_logger()
 
+# Default session timeout, shared by expiry scheduling and cleanup
+_DEFAULT_TIMEOUT_MINUTES = 30
+
+# Background sweep cadence: half the session timeout keeps worst-case
+# lingering of an expired session bounded without frequent wakeups
+_SWEEP_INTERVAL_SECONDS = _DEFAULT_TIMEOUT_MINUTES * 60 // 2
+
+# Conversation store sharding: 16 independently locked dicts keep lock
+# contention low when ASGI worker threads touch different sessions
+_SHARD_COUNT = 16
+_SHARD_MASK = _SHARD_COUNT - 1
+
+# Hard bound on live sessions across all shards: caps memory under
+# adversarial traffic where sessions are opened and never completed
+_MAX_CONVERSATIONS = 10_000
+
+# Affirmative / negative confirmation tokens, hoisted so each response is an
+# O(1) frozenset membership test instead of a rebuilt list scan
+_YES_RESPONSES = frozenset({"yes", "y", "yeah", "yep", "sure", "correct"})
+_NO_RESPONSES = frozenset({"no", "n", "nope", "incorrect"})
+
+# Ticker-shaped tokens (1-5 letters) for the selection branch: one C-level
+# regex scan over the response, each candidate resolved by dict lookup
+_TICKER_TOKEN_RE = re.compile(r"\b[A-Za-z]{1,5}\b")
+
+
+@lru_cache(maxsize=2048)
+def _format_options(suggestions: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """Format "Company (TICKER)" display options for a suggestion tuple.
+
+    Memoized: popular ambiguous queries resolve to the same suggestion
+    tuples over and over, so the .title() and f-string work is paid once.
+    """
+    return tuple(
+        f"{company.title()} ({ticker})" for company, ticker in suggestions
+    )
+
+
+@lru_cache(maxsize=2048)
+def _clarification_message(unresolved_names: Tuple[str, ...]) -> str:
+    """Build the clarification message for a tuple of unresolved names."""
+    if len(unresolved_names) == 1:
+        return (
+            f"I couldn't recognize '{unresolved_names[0]}'. "
+            "Could you please provide the stock ticker or full company name? "
+            "For example: 'AAPL' or 'Apple Inc.'"
+        )
+    names_str = "', '".join(unresolved_names)
+    return (
+        f"I couldn't recognize these companies: '{names_str}'. "
+        "Could you please provide their stock tickers or full company names? "
+        "For example: 'AAPL for Apple, MSFT for Microsoft'"
+    )
+
+
+class _CleanupTTLCache(TTLCache):
+    """TTL- and size-bounded shard that clears bulky session fields whenever
+    an entry leaves the cache by LRU eviction or TTL expiry."""
+
+    @staticmethod
+    def _release(conversation: "Conversation"):
+        conversation.user_responses.clear()
+        conversation.pending_companies = ()
+        conversation.pending_tickers = ()
+        conversation._ticker_index.clear()
+        conversation._company_index.clear()
+
+    def popitem(self):
+        key, conversation = super().popitem()
+        self._release(conversation)
+        return key, conversation
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _key, conversation in expired:
+            self._release(conversation)
+        return expired
+
 
 class ConversationState(str, Enum):
     """States of a conversation."""
@@ -20,7 +105,29 @@ class ConversationState(str, Enum):
 
 class Conversation:
     """Represents a conversation session."""
-    
+
+    # Fixed slot layout: drops the per-instance __dict__, roughly halving
+    # the footprint of each live session and speeding attribute access
+    __slots__ = (
+        "conversation_id",
+        "state",
+        "_created_ts",
+        "_last_ts",
+        "_created_wall",
+        "_timeout_seconds",
+        "original_query",
+        "resolved_tickers",
+        "pending_companies",
+        "pending_tickers",
+        "user_responses",
+        "final_query",
+        "confirmed_tickers",
+        "_ticker_index",
+        "_company_index",
+        "_log",
+        "__weakref__",
+    )
+
     def __init__(self, conversation_id: str):
         """
         Initialize a conversation.
@@ -30,39 +137,80 @@ class Conversation:
         """
         self.conversation_id = conversation_id
         self.state = ConversationState.INITIAL
-        self.created_at = datetime.now()
-        self.last_updated = datetime.now()
-        
-        # Conversation data
+        # Activity tracking uses monotonic floats — far cheaper per touch
+        # than datetime.now() and immune to wall-clock jumps; the wall time
+        # is kept once at creation so to_dict can materialize real datetimes
+        self._created_ts = self._last_ts = time.monotonic()
+        self._created_wall = time.time()
+        self._timeout_seconds = _DEFAULT_TIMEOUT_MINUTES * 60.0
+
+        # Conversation data. Pending suggestions are kept as two parallel
+        # tuples (structure-of-arrays) instead of a list of dicts — one
+        # allocation per side rather than a dict per suggestion, and tight
+        # tuple walks when matching responses.
         self.original_query: Optional[str] = None
         self.resolved_tickers: List[str] = []
-        self.pending_confirmations: List[Dict[str, Any]] = []
+        self.pending_companies: Tuple[str, ...] = ()
+        self.pending_tickers: Tuple[str, ...] = ()
         self.user_responses: List[str] = []
         self.final_query: Optional[str] = None
-        
+        self.confirmed_tickers: List[str] = []
+
+        # Suggestion lookup indexes, populated when a confirmation prompt is
+        # created: upper ticker / lower company -> (company, ticker)
+        self._ticker_index: Dict[str, Tuple[str, str]] = {}
+        self._company_index: Dict[str, Tuple[str, str]] = {}
+
+        # Logger with the conversation id bound once, so per-turn events
+        # reuse the bound context instead of repacking it as a kwarg
+        self._log = logger.bind(conversation_id=conversation_id)
+
+    @property
+    def pending_confirmations(self) -> List[Dict[str, str]]:
+        """List-of-dicts view of the pending suggestions, materialized on
+        demand for prompts and to_dict."""
+        return [
+            {"company": company, "ticker": ticker}
+            for company, ticker in zip(self.pending_companies, self.pending_tickers)
+        ]
+
+    @pending_confirmations.setter
+    def pending_confirmations(self, confirmations: List[Dict[str, str]]):
+        if confirmations:
+            self.pending_companies = tuple(c["company"] for c in confirmations)
+            self.pending_tickers = tuple(c["ticker"] for c in confirmations)
+        else:
+            self.pending_companies = ()
+            self.pending_tickers = ()
+
     def update(self):
-        """Update the last_updated timestamp."""
-        self.last_updated = datetime.now()
-    
-    def is_expired(self, timeout_minutes: int = 30) -> bool:
+        """Update the last-activity timestamp."""
+        self._last_ts = time.monotonic()
+
+    def is_expired(self, timeout_minutes: Optional[int] = None) -> bool:
         """
         Check if conversation has expired.
-        
+
         Args:
-            timeout_minutes: Timeout in minutes
-            
+            timeout_minutes: Timeout in minutes (defaults to the standard
+                session timeout, precomputed in seconds)
+
         Returns:
             True if expired
         """
-        return datetime.now() - self.last_updated > timedelta(minutes=timeout_minutes)
-    
+        timeout_seconds = (self._timeout_seconds if timeout_minutes is None
+                           else timeout_minutes * 60.0)
+        return time.monotonic() - self._last_ts > timeout_seconds
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert conversation to dictionary."""
+        created_wall = self._created_wall
+        last_wall = created_wall + (self._last_ts - self._created_ts)
         return {
             "conversation_id": self.conversation_id,
             "state": self.state.value,
-            "created_at": self.created_at.isoformat(),
-            "last_updated": self.last_updated.isoformat(),
+            "created_at": datetime.fromtimestamp(created_wall).isoformat(),
+            "last_updated": datetime.fromtimestamp(last_wall).isoformat(),
             "original_query": self.original_query,
             "resolved_tickers": self.resolved_tickers,
             "pending_confirmations": self.pending_confirmations,
@@ -78,22 +226,94 @@ class ConversationManager:
     
     def __init__(self):
         """Initialize the conversation manager."""
-        self.conversations: Dict[str, Conversation] = {}
+        # Striped store: conversations are sharded by id hash, each shard
+        # guarded by its own lock, so concurrent worker threads only contend
+        # when they hit the same shard. Each shard is TTL- and size-bounded,
+        # so abandoned sessions expire lazily on access and the whole store
+        # can never exceed _MAX_CONVERSATIONS entries.
+        self._shards: List[TTLCache] = [
+            _CleanupTTLCache(maxsize=_MAX_CONVERSATIONS // _SHARD_COUNT,
+                             ttl=_DEFAULT_TIMEOUT_MINUTES * 60)
+            for _ in range(_SHARD_COUNT)
+        ]
+        self._shard_locks: List[threading.Lock] = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        # Expiry heap with lazy deletion: every create/touch pushes a
+        # (deadline, conversation_id) entry and records the deadline as the
+        # current "version"; stale heap entries are discarded on pop when
+        # their deadline no longer matches. Cleanup then pops only entries
+        # whose deadline has passed instead of scanning every conversation.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expiry_version: Dict[str, float] = {}
+        self._expiry_lock = threading.Lock()
+        # Periodic background sweep keeps expiry work off the per-request
+        # path entirely; the daemon timer reschedules itself after each run
+        self._schedule_sweep()
         logger.info("ConversationManager initialized")
-    
+
+    def _schedule_sweep(self):
+        """Arm the next background cleanup timer."""
+        self._cleanup_timer = threading.Timer(_SWEEP_INTERVAL_SECONDS, self._sweep)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+
+    def _sweep(self):
+        """Run a cleanup pass, then reschedule."""
+        try:
+            self.cleanup_expired_conversations()
+        finally:
+            self._schedule_sweep()
+
+    def _shard_for(self, conversation_id: str) -> int:
+        """Pick the shard index for a conversation id."""
+        return hash(conversation_id) & _SHARD_MASK
+
+    def _store(self, conversation_id: str, conversation: Conversation):
+        """Insert a conversation into its shard."""
+        index = self._shard_for(conversation_id)
+        with self._shard_locks[index]:
+            self._shards[index][conversation_id] = conversation
+
+    def _load(self, conversation_id: str) -> Optional[Conversation]:
+        """Look up a conversation in its shard."""
+        index = self._shard_for(conversation_id)
+        with self._shard_locks[index]:
+            return self._shards[index].get(conversation_id)
+
+    def _evict(self, conversation_id: str) -> Optional[Conversation]:
+        """Remove and return a conversation from its shard."""
+        index = self._shard_for(conversation_id)
+        with self._shard_locks[index]:
+            return self._shards[index].pop(conversation_id, None)
+
+    def _schedule_expiry(self, conversation_id: str,
+                         timeout_minutes: int = _DEFAULT_TIMEOUT_MINUTES):
+        """Push a fresh expiry deadline for a conversation onto the heap."""
+        deadline = time.monotonic() + timeout_minutes * 60.0
+        with self._expiry_lock:
+            heapq.heappush(self._expiry_heap, (deadline, conversation_id))
+            self._expiry_version[conversation_id] = deadline
+
+    def _touch(self, conversation: Conversation):
+        """Mark a conversation active and reschedule its expiry."""
+        conversation.update()
+        # Re-inserting refreshes the shard's TTL for this entry
+        self._store(conversation.conversation_id, conversation)
+        self._schedule_expiry(conversation.conversation_id)
+
     def create_conversation(self, conversation_id: str) -> Conversation:
         """
         Create a new conversation.
-        
+
         Args:
             conversation_id: Unique conversation identifier
-            
+
         Returns:
             New conversation instance
         """
         conversation = Conversation(conversation_id)
-        self.conversations[conversation_id] = conversation
-        
+        self._store(conversation_id, conversation)
+        self._schedule_expiry(conversation_id)
+
         logger.info("Created conversation", conversation_id=conversation_id)
         return conversation
     
@@ -107,14 +327,9 @@ class ConversationManager:
         Returns:
             Conversation if found, None otherwise
         """
-        conversation = self.conversations.get(conversation_id)
-        
-        if conversation and conversation.is_expired():
-            logger.warning("Conversation expired", conversation_id=conversation_id)
-            self.delete_conversation(conversation_id)
-            return None
-        
-        return conversation
+        # The TTL-bounded shard drops expired entries lazily on access, so no
+        # explicit is_expired bookkeeping is needed here
+        return self._load(conversation_id)
     
     def delete_conversation(self, conversation_id: str):
         """
@@ -123,28 +338,42 @@ class ConversationManager:
         Args:
             conversation_id: Conversation identifier
         """
-        if conversation_id in self.conversations:
-            del self.conversations[conversation_id]
+        if self._evict(conversation_id) is not None:
+            with self._expiry_lock:
+                self._expiry_version.pop(conversation_id, None)
             logger.info("Deleted conversation", conversation_id=conversation_id)
-    
-    def cleanup_expired_conversations(self, timeout_minutes: int = 30):
+
+    def cleanup_expired_conversations(self, timeout_minutes: int = _DEFAULT_TIMEOUT_MINUTES):
         """
         Clean up expired conversations.
-        
+
+        Pops passed deadlines off the expiry heap — O(k log N) for k actually
+        expired sessions — instead of scanning every live conversation.
+        Deadlines are fixed when scheduled, so timeout_minutes only applies
+        to entries created after a change.
+
         Args:
             timeout_minutes: Timeout in minutes
         """
-        expired_ids = [
-            conv_id for conv_id, conv in self.conversations.items()
-            if conv.is_expired(timeout_minutes)
-        ]
-        
-        for conv_id in expired_ids:
+        now = time.monotonic()
+
+        # Collect expired ids under the expiry lock, then delete outside it
+        # so the per-shard locks are never nested inside it
+        expired: List[str] = []
+        with self._expiry_lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                deadline, conv_id = heapq.heappop(self._expiry_heap)
+                # Lazy deletion: only act on the entry matching the latest
+                # scheduled deadline; earlier entries for the same id are stale
+                if self._expiry_version.get(conv_id) == deadline:
+                    expired.append(conv_id)
+
+        for conv_id in expired:
             self.delete_conversation(conv_id)
-        
-        if expired_ids:
-            logger.info("Cleaned up expired conversations", 
-                       count=len(expired_ids))
+
+        if expired:
+            logger.info("Cleaned up expired conversations",
+                       count=len(expired))
     
     def create_confirmation_prompt(
         self, 
@@ -162,34 +391,50 @@ class ConversationManager:
             Confirmation prompt data
         """
         conversation.state = ConversationState.AWAITING_CONFIRMATION
-        conversation.pending_confirmations = [
-            {"company": company, "ticker": ticker}
+        # Interning collapses the duplicate short strings (AAPL, MSFT, ...)
+        # that recur across thousands of conversations into shared objects
+        suggestions = [
+            (sys.intern(company), sys.intern(ticker))
             for company, ticker in suggestions
         ]
-        conversation.update()
+        if suggestions:
+            conversation.pending_companies, conversation.pending_tickers = (
+                tuple(companies) for companies in zip(*suggestions)
+            )
+        else:
+            conversation.pending_companies = ()
+            conversation.pending_tickers = ()
+        # Materialize the dict view once for the prompt payload
+        suggestion_dicts = conversation.pending_confirmations
+        # Index the suggestions once so response matching is a dict walk with
+        # precomputed case, not repeated upper/lower copies per candidate
+        conversation._ticker_index = {
+            ticker.upper(): (company, ticker) for company, ticker in suggestions
+        }
+        conversation._company_index = {
+            company.lower(): (company, ticker) for company, ticker in suggestions
+        }
+        self._touch(conversation)
         
+        options = _format_options(tuple(suggestions))
+
         if len(suggestions) == 1:
-            company, ticker = suggestions[0]
             prompt = {
                 "type": "confirmation",
-                "message": f"Did you mean {company.title()} ({ticker})?",
+                "message": f"Did you mean {options[0]}?",
                 "options": ["Yes", "No"],
-                "suggestions": conversation.pending_confirmations
+                "suggestions": suggestion_dicts
             }
         else:
             prompt = {
                 "type": "selection",
                 "message": "I found multiple matches. Which company did you mean?",
-                "options": [
-                    f"{company.title()} ({ticker})"
-                    for company, ticker in suggestions
-                ] + ["None of these"],
-                "suggestions": conversation.pending_confirmations
+                "options": list(options) + ["None of these"],
+                "suggestions": suggestion_dicts
             }
         
-        logger.info("Created confirmation prompt",
-                   conversation_id=conversation.conversation_id,
-                   suggestions_count=len(suggestions))
+        conversation._log.info("Created confirmation prompt",
+                              suggestions_count=len(suggestions))
         
         return prompt
     
@@ -209,31 +454,16 @@ class ConversationManager:
             Clarification prompt data
         """
         conversation.state = ConversationState.AWAITING_CLARIFICATION
-        conversation.update()
-        
-        if len(unresolved_names) == 1:
-            message = (
-                f"I couldn't recognize '{unresolved_names[0]}'. "
-                "Could you please provide the stock ticker or full company name? "
-                "For example: 'AAPL' or 'Apple Inc.'"
-            )
-        else:
-            names_str = "', '".join(unresolved_names)
-            message = (
-                f"I couldn't recognize these companies: '{names_str}'. "
-                "Could you please provide their stock tickers or full company names? "
-                "For example: 'AAPL for Apple, MSFT for Microsoft'"
-            )
-        
+        self._touch(conversation)
+
         prompt = {
             "type": "clarification",
-            "message": message,
+            "message": _clarification_message(tuple(unresolved_names)),
             "unresolved_names": unresolved_names
         }
         
-        logger.info("Created clarification prompt",
-                   conversation_id=conversation.conversation_id,
-                   unresolved_count=len(unresolved_names))
+        conversation._log.info("Created clarification prompt",
+                              unresolved_count=len(unresolved_names))
         
         return prompt
     
@@ -253,34 +483,40 @@ class ConversationManager:
             Processing result
         """
         conversation.user_responses.append(response)
-        conversation.update()
-        
+        self._touch(conversation)
+
+        # One case-normalized copy each, reused by every membership test below
         response_lower = response.lower().strip()
-        
+
         # Handle "Yes" response - confirm ALL tickers at once
-        if response_lower in ["yes", "y", "yeah", "yep", "sure", "correct"]:
+        if response_lower in _YES_RESPONSES:
             # All tickers are already in confirmed_tickers from the initial detection
             conversation.state = ConversationState.READY_FOR_ANALYSIS
             
-            tickers = getattr(conversation, 'confirmed_tickers', [])
-            
-            logger.info("User confirmed all suggestions",
-                       conversation_id=conversation.conversation_id,
-                       tickers=tickers)
-            
+            tickers = conversation.confirmed_tickers
+
+            # Per-turn hot path: keep the info event minimal and leave the
+            # ticker payload to debug, which the filtering logger compiles
+            # away outside DEBUG deployments
+            conversation._log.info("User confirmed all suggestions")
+            conversation._log.debug("Confirmed tickers", tickers=tickers)
+
+            # Join once and reuse for both the ticker field and the message
+            joined = ", ".join(tickers) if tickers else "unknown"
+
             return {
                 "status": "confirmed",
-                "ticker": ", ".join(tickers) if tickers else "unknown",
-                "message": f"Great! I'll analyze {', '.join(tickers)}."
+                "ticker": joined,
+                "message": f"Great! I'll analyze {joined}."
             }
         
         # Handle "No" response
-        elif response_lower in ["no", "n", "nope", "incorrect"]:
+        elif response_lower in _NO_RESPONSES:
             conversation.state = ConversationState.AWAITING_CLARIFICATION
-            conversation.pending_confirmations = []
+            conversation.pending_companies = ()
+            conversation.pending_tickers = ()
             
-            logger.info("User rejected suggestion",
-                       conversation_id=conversation.conversation_id)
+            conversation._log.info("User rejected suggestion")
             
             return {
                 "status": "rejected",
@@ -292,30 +528,52 @@ class ConversationManager:
         
         # Handle selection from multiple options
         else:
-            # Try to extract ticker from response
-            for confirmation in conversation.pending_confirmations:
-                ticker = confirmation["ticker"]
-                company = confirmation["company"]
-                
-                if ticker in response.upper() or company in response.lower():
-                    conversation.resolved_tickers.append(ticker)
-                    conversation.pending_confirmations = []
-                    conversation.state = ConversationState.READY_FOR_ANALYSIS
-                    
-                    logger.info("User selected option",
-                               conversation_id=conversation.conversation_id,
-                               ticker=ticker)
-                    
-                    return {
-                        "status": "confirmed",
-                        "ticker": ticker,
-                        "message": f"Perfect! I'll analyze {ticker}."
-                    }
+            # Prompts created before the indexes existed fall back to the
+            # pending list
+            if not conversation._ticker_index and conversation.pending_tickers:
+                pairs = list(zip(conversation.pending_companies,
+                                 conversation.pending_tickers))
+                conversation._ticker_index = {
+                    ticker.upper(): (company, ticker) for company, ticker in pairs
+                }
+                conversation._company_index = {
+                    company.lower(): (company, ticker) for company, ticker in pairs
+                }
+
+            # Extract ticker candidates in one regex scan and resolve each
+            # with an O(1) index lookup — no per-candidate substring search
+            matched = None
+            ticker_index = conversation._ticker_index
+            if ticker_index:
+                for token in _TICKER_TOKEN_RE.finditer(response):
+                    entry = ticker_index.get(token.group().upper())
+                    if entry is not None:
+                        matched = entry
+                        break
+            if matched is None:
+                for company_key, entry in conversation._company_index.items():
+                    if company_key in response_lower:
+                        matched = entry
+                        break
+
+            if matched is not None:
+                _company, ticker = matched
+                conversation.resolved_tickers.append(ticker)
+                conversation.pending_companies = ()
+                conversation.pending_tickers = ()
+                conversation.state = ConversationState.READY_FOR_ANALYSIS
+
+                conversation._log.info("User selected option", ticker=ticker)
+
+                return {
+                    "status": "confirmed",
+                    "ticker": ticker,
+                    "message": f"Perfect! I'll analyze {ticker}."
+                }
             
             # Could not parse response
-            logger.warning("Could not parse confirmation response",
-                          conversation_id=conversation.conversation_id,
-                          response=response)
+            conversation._log.warning("Could not parse confirmation response",
+                                     response=response)
             
             return {
                 "status": "unclear",
@@ -343,7 +601,7 @@ class ConversationManager:
         from backend.services.ticker_mapper import get_ticker_mapper
         
         conversation.user_responses.append(response)
-        conversation.update()
+        self._touch(conversation)
         
         ticker_mapper = get_ticker_mapper()
         
@@ -351,12 +609,11 @@ class ConversationManager:
         resolved, unresolved = ticker_mapper.extract_tickers_from_query(response)
         
         if resolved:
-            conversation.resolved_tickers.extend(resolved)
+            conversation.resolved_tickers.extend(sys.intern(t) for t in resolved)
             conversation.state = ConversationState.READY_FOR_ANALYSIS
             
-            logger.info("Resolved tickers from clarification",
-                       conversation_id=conversation.conversation_id,
-                       tickers=resolved)
+            conversation._log.info("Resolved tickers from clarification")
+            conversation._log.debug("Clarification tickers", tickers=resolved)
             
             return {
                 "status": "resolved",
@@ -365,9 +622,8 @@ class ConversationManager:
             }
         
         else:
-            logger.warning("Could not resolve tickers from clarification",
-                          conversation_id=conversation.conversation_id,
-                          response=response)
+            conversation._log.warning("Could not resolve tickers from clarification",
+                                     response=response)
             
             return {
                 "status": "still_unclear",
@@ -379,14 +635,13 @@ class ConversationManager:
             }
 
 
-# Global instance
-_conversation_manager = None
+# Global instance, created eagerly at import: the lazy None-check it replaces
+# could race under concurrent worker threads and split session state across
+# two managers. Construction is trivially cheap, so there is nothing to defer.
+_conversation_manager = ConversationManager()
 
 
 def get_conversation_manager() -> ConversationManager:
     """Get the global conversation manager instance."""
-    global _conversation_manager
-    if _conversation_manager is None:
-        _conversation_manager = ConversationManager()
     return _conversation_manager
 
@@ -1,64 +1,133 @@
 """
 Improved Gemini AI Service - Enhanced prompts for detailed, specific analysis.
 """
+import asyncio
 import google.generativeai as genai
+import cachetools
+import functools
+import inspect
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 import structlog
 from dotenv import load_dotenv
 
+from backend.tools.yahoo_finance_tool import NewsArticle
+
 load_dotenv()
 
 logger = structlog.get_logger()
 
 
-class GeminiService:
-    """Service for interacting with Google's Gemini AI API with enhanced prompts."""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize Gemini service.
-        
-        Args:
-            api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
-        """
-        self.api_key = api_key or os.getenv('GEMINI_API_KEY') 
+def _ttl_hash_cache(maxsize: int, ttl: int, make_key):
+    """
+    Memoize a GeminiService method on a TTL cache keyed by stable fields
+    of its inputs.
 
-        if not self.api_key:
-            logger.warning("GEMINI_API_KEY not found, some features may not work")
-        
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-    
-    def summarize_news(self, ticker: str, news_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Summarize news articles using Gemini with enhanced prompts.
-        
-        Args:
-            ticker: Stock ticker symbol
-            news_articles: List of news articles
-            
-        Returns:
-            Dictionary containing summary, sentiment, and key points
-        """
-        if not news_articles:
-            return {
-                'summary': f'No recent news available for {ticker}. Market activity continues with normal trading patterns.',
-                'sentiment': 'neutral',
-                'key_points': []
-            }
-        
-        # Prepare news text
-        news_text = "\n\n".join([
-            f"Title: {article['title']}\nPublisher: {article['publisher']}\nDate: {article['published_at']}\nSummary: {article['snippet']}"
-            for article in news_articles[:5]
-        ])
-        
-        prompt = f"""You are a professional financial analyst at a top investment bank. Analyze the following news articles about {ticker} and provide detailed, actionable insights.
+    Dashboards re-request the same (ticker, content) within minutes; every
+    cache hit skips a full LLM round trip. make_key receives the bound
+    arguments by name and returns a hashable key. Works on both sync and
+    async methods; each decorated function gets its own cache.
+    """
+    def decorator(fn):
+        cache = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        sig = inspect.signature(fn)
 
-NEWS ARTICLES:
-{news_text}
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(self, *args, **kwargs):
+                bound = sig.bind(self, *args, **kwargs)
+                try:
+                    key = make_key(bound.arguments)
+                except (AttributeError, KeyError, TypeError):
+                    # Malformed input (e.g. dicts where NewsArticle records
+                    # are expected) degrades to an uncached call
+                    return await fn(self, *args, **kwargs)
+
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+
+                result = await fn(self, *args, **kwargs)
+                # Don't pin failures for the full TTL
+                if isinstance(result, dict) and 'error' not in result:
+                    cache[key] = result
+                return result
+        else:
+            @functools.wraps(fn)
+            def wrapper(self, *args, **kwargs):
+                bound = sig.bind(self, *args, **kwargs)
+                try:
+                    key = make_key(bound.arguments)
+                except (AttributeError, KeyError, TypeError):
+                    # Malformed input (e.g. dicts where NewsArticle records
+                    # are expected) degrades to an uncached call
+                    return fn(self, *args, **kwargs)
+
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+
+                result = fn(self, *args, **kwargs)
+                # Don't pin failures for the full TTL
+                if isinstance(result, dict) and 'error' not in result:
+                    cache[key] = result
+                return result
+
+        return wrapper
+    return decorator
+
+
+def _news_key(args: Dict[str, Any]):
+    return (args['ticker'], tuple(a.url for a in args['news_articles'][:5]))
+
+
+def _price_key(args: Dict[str, Any]):
+    price_data = args['price_data']
+    return (args['ticker'], round(price_data.get('current_price') or 0, 2), price_data.get('trend'))
+
+
+def _analysis_key(args: Dict[str, Any]):
+    price_data = args['price_data']
+    return (
+        args['ticker'],
+        round(price_data.get('current_price') or 0, 2),
+        price_data.get('trend'),
+        args['news_summary'].get('sentiment')
+    )
+
+
+def _bundle_key(args: Dict[str, Any]):
+    price_data = args['price_data']
+    return (
+        args['ticker'],
+        tuple(a.url for a in args['news_articles'][:5]),
+        round(price_data.get('current_price') or 0, 2),
+        price_data.get('trend')
+    )
+
+
+# How many tickers to fold into one batched bundle call. Larger chunks cut
+# the request count further but risk running into output token limits.
+BATCH_CHUNK_SIZE = 5
+
+
+def _strip_json_fences(text: str) -> str:
+    """Strip markdown code fences that Gemini sometimes wraps around JSON."""
+    if '```json' in text:
+        return text.split('```json')[1].split('```')[0].strip()
+    if '```' in text:
+        return text.split('```')[1].split('```')[0].strip()
+    return text
+
+
+# Static prompt prefixes. Gemini applies implicit caching to repeated request
+# prefixes, so each prompt keeps its boilerplate (role, instructions, output
+# schema) byte-identical and up front, and appends the per-ticker data last.
+
+_NEWS_PROMPT_PREFIX = """You are a professional financial analyst at a top investment bank. Analyze the news articles for the stock given at the end of this prompt and provide detailed, actionable insights.
 
 INSTRUCTIONS:
 1. Write a comprehensive 3-4 sentence summary that covers the main developments, their business impact, and market implications
@@ -66,7 +135,7 @@ INSTRUCTIONS:
 3. Extract 5 specific, actionable key points that investors should know
 
 Provide your analysis in JSON format:
-{{
+{
     "summary": "Detailed 3-4 sentence summary covering main developments, business impact, and market implications",
     "sentiment": "positive, negative, or neutral",
     "key_points": [
@@ -76,107 +145,78 @@ Provide your analysis in JSON format:
         "Specific point 4 with concrete details",
         "Specific point 5 with concrete details"
     ]
-}}
+}
 
 Respond with ONLY the JSON, no additional text."""
-        
-        try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-            
-            # Extract JSON from response
-            if '```json' in result_text:
-                result_text = result_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in result_text:
-                result_text = result_text.split('```')[1].split('```')[0].strip()
-            
-            result = json.loads(result_text)
-            logger.info(f"Successfully summarized news for {ticker}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error summarizing news for {ticker}", error=str(e))
-            # Better fallback with more detail
-            return {
-                'summary': f'{ticker} continues to show market activity with recent developments in operations and strategic initiatives. The company maintains its position in the market while navigating current economic conditions. Investor attention remains focused on upcoming catalysts and financial performance.',
-                'sentiment': 'neutral',
-                'key_points': [article['title'] for article in news_articles[:5]]
-            }
-    
-    def generate_investment_analysis(
-        self,
-        ticker: str,
-        company_name: str,
-        news_summary: Dict[str, Any],
-        price_data: Dict[str, Any],
-        financial_metrics: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Generate comprehensive investment analysis using Gemini with enhanced prompts.
-        
-        Args:
-            ticker: Stock ticker symbol
-            company_name: Company name
-            news_summary: Summarized news data
-            price_data: Price and technical data
-            financial_metrics: Financial metrics
-            
-        Returns:
-            Dictionary containing detailed investment analysis
-        """
-        # Format financial metrics, only include what we have
-        pe_ratio = financial_metrics.get('pe_ratio', 0)
-        profit_margin = financial_metrics.get('profit_margin', 0)
-        revenue_growth = financial_metrics.get('revenue_growth')
-        market_cap = financial_metrics.get('market_cap', 0)
-        eps = financial_metrics.get('eps', 0)
-        
-        # Calculate price change
-        current_price = price_data.get('current_price', 0)
-        high_52w = price_data.get('high_52w', 0) or financial_metrics.get('fifty_two_week_high', 0)
-        low_52w = price_data.get('low_52w', 0) or financial_metrics.get('fifty_two_week_low', 0)
-        
-        if high_52w and low_52w and current_price:
-            price_change_pct = ((current_price - low_52w) / low_52w) * 100
-        else:
-            price_change_pct = 0
-        
-        # Format revenue growth display - handle None and 0 differently
-        if revenue_growth is None:
-            revenue_growth_display = "N/A (data not available)"
-            revenue_growth_value = 0  # For calculations
-        elif revenue_growth == 0:
-            revenue_growth_display = "0.00% (flat or data unavailable)"
-            revenue_growth_value = 0
-        else:
-            revenue_growth_display = f"{revenue_growth*100:.2f}%"
-            revenue_growth_value = revenue_growth
-        
-        prompt = f"""You are a senior equity research analyst at Goldman Sachs. Provide a detailed investment analysis for {ticker} ({company_name}).
 
-CURRENT DATA:
+_BUNDLE_PROMPT_PREFIX = """You are a senior equity research analyst. Produce a complete research note for the stock given at the end of this prompt in one pass, covering news, technicals, and the investment call.
 
-News Summary:
-{news_summary.get('summary', 'No news available')}
+INSTRUCTIONS:
+1. news_summary: 3-4 sentence summary of the main developments, overall sentiment (positive, negative, or neutral), and 5 specific key points
+2. technical_analysis: 3 support levels, 3 resistance levels, and a 2-3 sentence technical summary with specific price levels
+3. investment_analysis: detailed 3-4 sentence rationale, 5 key drivers, 5 specific risks, 5 time-bound catalysts, a stance (buy, hold, or sell), a confidence level (high, medium, or low), and a 2-3 sentence confidence rationale
 
-Sentiment: {news_summary.get('sentiment', 'neutral')}
+Provide your analysis in JSON format:
+{
+    "news_summary": {
+        "summary": "...",
+        "sentiment": "positive, negative, or neutral",
+        "key_points": ["...", "...", "...", "...", "..."]
+    },
+    "technical_analysis": {
+        "support_levels": [level1, level2, level3],
+        "resistance_levels": [level1, level2, level3],
+        "technical_summary": "..."
+    },
+    "investment_analysis": {
+        "rationale": "...",
+        "key_drivers": ["...", "...", "...", "...", "..."],
+        "risks": ["...", "...", "...", "...", "..."],
+        "catalysts": ["...", "...", "...", "...", "..."],
+        "stance": "buy, hold, or sell",
+        "confidence": "high, medium, or low",
+        "confidence_rationale": "..."
+    }
+}
 
-Key Developments:
-{chr(10).join(['- ' + point for point in news_summary.get('key_points', [])])}
+Respond with ONLY the JSON, no additional text."""
 
-Price Data:
-- Current Price: ${current_price:.2f}
-- 52-Week High: ${high_52w:.2f}
-- 52-Week Low: ${low_52w:.2f}
-- Trend: {price_data.get('trend', 'neutral')}
-- Price Change from 52W Low: {price_change_pct:.2f}%
+_BATCH_BUNDLE_PROMPT_PREFIX = """You are a senior equity research analyst. Produce a complete research note for EACH of the stocks given at the end of this prompt in one pass. Each stock's data is enclosed in a <TICKER id="..."> block.
 
-Financial Metrics:
-- Market Cap: ${market_cap:,.0f}
-- P/E Ratio (TTM): {pe_ratio:.2f}x
-- EPS (TTM): ${eps:.2f}
-- Profit Margin: {profit_margin*100:.2f}%
-- Revenue Growth: {revenue_growth_display}
+INSTRUCTIONS (apply to every stock independently):
+1. news_summary: 3-4 sentence summary of the main developments, overall sentiment (positive, negative, or neutral), and 5 specific key points
+2. technical_analysis: 3 support levels, 3 resistance levels, and a 2-3 sentence technical summary with specific price levels
+3. investment_analysis: detailed 3-4 sentence rationale, 5 key drivers, 5 specific risks, 5 time-bound catalysts, a stance (buy, hold, or sell), a confidence level (high, medium, or low), and a 2-3 sentence confidence rationale
+
+Provide your analysis as a JSON array with one object per stock, in the same order as the input blocks:
+[
+    {
+        "ticker": "the id of the <TICKER> block",
+        "news_summary": {
+            "summary": "...",
+            "sentiment": "positive, negative, or neutral",
+            "key_points": ["...", "...", "...", "...", "..."]
+        },
+        "technical_analysis": {
+            "support_levels": [level1, level2, level3],
+            "resistance_levels": [level1, level2, level3],
+            "technical_summary": "..."
+        },
+        "investment_analysis": {
+            "rationale": "...",
+            "key_drivers": ["...", "...", "...", "...", "..."],
+            "risks": ["...", "...", "...", "...", "..."],
+            "catalysts": ["...", "...", "...", "...", "..."],
+            "stance": "buy, hold, or sell",
+            "confidence": "high, medium, or low",
+            "confidence_rationale": "..."
+        }
+    }
+]
+
+Respond with ONLY the JSON array, no additional text."""
+
+_ANALYSIS_PROMPT_PREFIX = """You are a senior equity research analyst at Goldman Sachs. Provide a detailed investment analysis for the stock given at the end of this prompt.
 
 INSTRUCTIONS:
 Provide a comprehensive investment analysis with:
@@ -213,7 +253,7 @@ Provide a comprehensive investment analysis with:
    - low: Limited data, high uncertainty, conflicting signals
 
 Provide your analysis in JSON format:
-{{
+{
     "rationale": "Detailed 3-4 sentence investment thesis with specific reasoning and outlook",
     "key_drivers": [
         "Specific driver 1 with measurable impact (e.g., 'Services revenue growing 15% YoY driving margin expansion')",
@@ -239,86 +279,634 @@ Provide your analysis in JSON format:
     "stance": "buy, hold, or sell",
     "confidence": "high, medium, or low",
     "confidence_rationale": "2-3 sentences explaining the confidence level based on data quality, market conditions, and outlook clarity"
-}}
+}
+
+Respond with ONLY the JSON, no additional text."""
+
+_TECHNICAL_PROMPT_PREFIX = """You are a professional technical analyst. Analyze the price levels for the stock given at the end of this prompt.
+
+Provide technical analysis in JSON format:
+{
+    "support_levels": [level1, level2, level3],
+    "resistance_levels": [level1, level2, level3],
+    "technical_summary": "2-3 sentence technical summary with specific price levels and trend analysis"
+}
 
 Respond with ONLY the JSON, no additional text."""
+
+
+def _ticker_data_section(
+    ticker: str,
+    company_name: str,
+    news_articles: Sequence[NewsArticle],
+    price_data: Dict[str, Any],
+    financial_metrics: Dict[str, Any]
+) -> str:
+    """Render one ticker's news/price/financial data as a prompt section.
+
+    Shared by the single-ticker bundle prompt and the batched variant so
+    both feed the model identically formatted data.
+    """
+    if news_articles:
+        news_text = "\n\n".join([
+            f"Title: {article.title}\nPublisher: {article.publisher}\nDate: {article.published_at}\nSummary: {article.snippet}"
+            for article in news_articles[:5]
+        ])
+    else:
+        news_text = "No recent news articles available."
+
+    current_price = price_data.get('current_price', 0)
+    pe_ratio = financial_metrics.get('pe_ratio', 0) or 0
+    profit_margin = financial_metrics.get('profit_margin', 0) or 0
+    market_cap = financial_metrics.get('market_cap', 0) or 0
+    eps = financial_metrics.get('eps', 0) or 0
+    high_52w = price_data.get('high_52w', 0) or financial_metrics.get('fifty_two_week_high', 0)
+    low_52w = price_data.get('low_52w', 0) or financial_metrics.get('fifty_two_week_low', 0)
+
+    return f"""TICKER: {ticker} ({company_name})
+
+NEWS ARTICLES:
+{news_text}
+
+PRICE DATA:
+- Current Price: ${current_price:.2f}
+- 52-Week High: ${high_52w:.2f}
+- 52-Week Low: ${low_52w:.2f}
+- Trend: {price_data.get('trend', 'neutral')}
+- 20-Day MA: ${price_data.get('ma_20', 0):.2f}
+- 50-Day MA: ${price_data.get('ma_50', 0):.2f}
+- Recent Support Levels: {', '.join([f'${x:.2f}' for x in price_data.get('support_levels', [])])}
+- Recent Resistance Levels: {', '.join([f'${x:.2f}' for x in price_data.get('resistance_levels', [])])}
+
+FINANCIAL METRICS:
+- Market Cap: ${market_cap:,.0f}
+- P/E Ratio (TTM): {pe_ratio:.2f}x
+- EPS (TTM): ${eps:.2f}
+- Profit Margin: {profit_margin*100:.2f}%"""
+
+
+# Prompt builders and data-driven fallbacks, shared between the sync methods
+# and their async variants so both paths send byte-identical prompts and
+# degrade identically when a call fails.
+
+def _news_prompt(ticker: str, news_articles: Sequence[NewsArticle]) -> str:
+    news_text = "\n\n".join([
+        f"Title: {article.title}\nPublisher: {article.publisher}\nDate: {article.published_at}\nSummary: {article.snippet}"
+        for article in news_articles[:5]
+    ])
+    return _NEWS_PROMPT_PREFIX + f"""
+
+TICKER: {ticker}
+
+NEWS ARTICLES:
+{news_text}"""
+
+
+def _no_news_result(ticker: str) -> Dict[str, Any]:
+    return {
+        'summary': f'No recent news available for {ticker}. Market activity continues with normal trading patterns.',
+        'sentiment': 'neutral',
+        'key_points': []
+    }
+
+
+def _news_fallback(ticker: str, news_articles: Sequence[NewsArticle]) -> Dict[str, Any]:
+    return {
+        'summary': f'{ticker} continues to show market activity with recent developments in operations and strategic initiatives. The company maintains its position in the market while navigating current economic conditions. Investor attention remains focused on upcoming catalysts and financial performance.',
+        'sentiment': 'neutral',
+        'key_points': [article.title for article in news_articles[:5]]
+    }
+
+
+def _technical_prompt(ticker: str, price_data: Dict[str, Any]) -> str:
+    return _TECHNICAL_PROMPT_PREFIX + f"""
+
+TICKER: {ticker}
+
+Current Price: ${price_data.get('current_price', 0):.2f}
+52-Week High: ${price_data.get('high_52w', 0):.2f}
+52-Week Low: ${price_data.get('low_52w', 0):.2f}
+Trend: {price_data.get('trend', 'neutral')}
+20-Day MA: ${price_data.get('ma_20', 0):.2f}
+50-Day MA: ${price_data.get('ma_50', 0):.2f}
+
+Recent Resistance Levels: {', '.join([f'${x:.2f}' for x in price_data.get('resistance_levels', [])])}
+Recent Support Levels: {', '.join([f'${x:.2f}' for x in price_data.get('support_levels', [])])}"""
+
+
+def _technical_fallback(ticker: str, price_data: Dict[str, Any]) -> Dict[str, Any]:
+    current_price = price_data.get('current_price', 0)
+    trend = price_data.get('trend', 'neutral')
+    return {
+        'support_levels': price_data.get('support_levels', [])[:3],
+        'resistance_levels': price_data.get('resistance_levels', [])[:3],
+        'technical_summary': f'{ticker} is currently trading at ${current_price:.2f} in a {trend} trend. The stock is positioned between key support levels at {", ".join([f"${x:.2f}" for x in price_data.get("support_levels", [])[:2]])} and resistance at {", ".join([f"${x:.2f}" for x in price_data.get("resistance_levels", [])[:2]])}. Technical indicators suggest monitoring these levels for potential breakout or breakdown signals.'
+    }
+
+
+def _analysis_prompt(
+    ticker: str,
+    company_name: str,
+    news_summary: Dict[str, Any],
+    price_data: Dict[str, Any],
+    financial_metrics: Dict[str, Any]
+) -> str:
+    # Format financial metrics, only include what we have
+    pe_ratio = financial_metrics.get('pe_ratio', 0)
+    profit_margin = financial_metrics.get('profit_margin', 0)
+    revenue_growth = financial_metrics.get('revenue_growth')
+    market_cap = financial_metrics.get('market_cap', 0)
+    eps = financial_metrics.get('eps', 0)
+
+    # Calculate price change
+    current_price = price_data.get('current_price', 0)
+    high_52w = price_data.get('high_52w', 0) or financial_metrics.get('fifty_two_week_high', 0)
+    low_52w = price_data.get('low_52w', 0) or financial_metrics.get('fifty_two_week_low', 0)
+
+    if high_52w and low_52w and current_price:
+        price_change_pct = ((current_price - low_52w) / low_52w) * 100
+    else:
+        price_change_pct = 0
+
+    # Format revenue growth display - handle None and 0 differently
+    if revenue_growth is None:
+        revenue_growth_display = "N/A (data not available)"
+    elif revenue_growth == 0:
+        revenue_growth_display = "0.00% (flat or data unavailable)"
+    else:
+        revenue_growth_display = f"{revenue_growth*100:.2f}%"
+
+    return _ANALYSIS_PROMPT_PREFIX + f"""
+
+TICKER: {ticker} ({company_name})
+
+CURRENT DATA:
+
+News Summary:
+{news_summary.get('summary', 'No news available')}
+
+Sentiment: {news_summary.get('sentiment', 'neutral')}
+
+Key Developments:
+{chr(10).join(['- ' + point for point in news_summary.get('key_points', [])])}
+
+Price Data:
+- Current Price: ${current_price:.2f}
+- 52-Week High: ${high_52w:.2f}
+- 52-Week Low: ${low_52w:.2f}
+- Trend: {price_data.get('trend', 'neutral')}
+- Price Change from 52W Low: {price_change_pct:.2f}%
+
+Financial Metrics:
+- Market Cap: ${market_cap:,.0f}
+- P/E Ratio (TTM): {pe_ratio:.2f}x
+- EPS (TTM): ${eps:.2f}
+- Profit Margin: {profit_margin*100:.2f}%
+- Revenue Growth: {revenue_growth_display}"""
+
+
+def _analysis_fallback(
+    ticker: str,
+    company_name: str,
+    news_summary: Dict[str, Any],
+    price_data: Dict[str, Any],
+    financial_metrics: Dict[str, Any]
+) -> Dict[str, Any]:
+    # Enhanced fallback with more specific content
+    trend = price_data.get('trend', 'neutral')
+    current_price = price_data.get('current_price', 0)
+    high_52w = price_data.get('high_52w', 0) or financial_metrics.get('fifty_two_week_high', 0)
+    low_52w = price_data.get('low_52w', 0) or financial_metrics.get('fifty_two_week_low', 0)
+
+    if high_52w and low_52w and current_price:
+        price_change = ((current_price - low_52w) / low_52w) * 100
+    else:
+        price_change = 0
+
+    sentiment = news_summary.get('sentiment', 'neutral')
+    pe_ratio = financial_metrics.get('pe_ratio', 0)
+    profit_margin = financial_metrics.get('profit_margin', 0)
+    revenue_growth = financial_metrics.get('revenue_growth')
+
+    # Determine stance based on data
+    if trend == 'bullish' and sentiment == 'positive' and price_change > 5:
+        stance = 'buy'
+        confidence = 'medium'
+    elif trend == 'bearish' and sentiment == 'negative' and price_change < -5:
+        stance = 'sell'
+        confidence = 'medium'
+    else:
+        stance = 'hold'
+        confidence = 'medium'
+
+    # Format revenue growth for fallback message
+    if not revenue_growth:
+        revenue_growth_text = "with revenue growth data unavailable"
+    else:
+        revenue_growth_text = f"with {revenue_growth*100:.1f}% revenue growth"
+
+    return {
+        'rationale': f'{company_name} ({ticker}) demonstrates a {trend} technical trend with {sentiment} market sentiment. The stock has moved {abs(price_change):.1f}% from its 52-week low, trading at a P/E ratio of {pe_ratio:.1f}x. Based on current fundamentals including {profit_margin*100:.1f}% profit margins, the company maintains a stable market position. The investment outlook suggests a {stance} recommendation with {confidence} confidence given the current market dynamics and company-specific factors.',
+        'key_drivers': [
+            f'Profit margin of {profit_margin*100:.1f}% demonstrating strong operational efficiency',
+            f'P/E ratio of {pe_ratio:.1f}x indicating market valuation relative to earnings',
+            'Strategic market positioning and competitive advantages in core business segments',
+            'Innovation pipeline and product development initiatives driving future growth',
+            'Brand strength and customer loyalty supporting pricing power'
+        ],
+        'risks': [
+            f'Current P/E ratio of {pe_ratio:.1f}x may indicate valuation concerns',
+            'Macroeconomic headwinds including interest rate environment and inflation pressures',
+            'Competitive intensity in key markets potentially impacting market share',
+            'Regulatory environment changes that could affect business operations',
+            'Limited revenue growth visibility requiring close monitoring of business trends'
+        ],
+        'catalysts': [
+            'Next quarterly earnings announcement expected to provide updated guidance',
+            'Upcoming product launches and service expansions in key markets',
+            'Potential strategic partnerships or M&A activity to enhance market position',
+            'Industry conference presentations and investor day events',
+            'Analyst day or capital markets day with long-term financial targets'
+        ],
+        'stance': stance,
+        'confidence': confidence,
+        'confidence_rationale': f'Confidence level is {confidence} based on the {trend} price trend, {sentiment} news sentiment, and {abs(price_change):.1f}% price movement. The analysis incorporates available financial metrics {revenue_growth_text}, though some uncertainty remains regarding near-term catalysts and market conditions.'
+    }
+
+
+def _bundle_prompt(
+    ticker: str,
+    company_name: str,
+    news_articles: Sequence[NewsArticle],
+    price_data: Dict[str, Any],
+    financial_metrics: Dict[str, Any]
+) -> str:
+    return _BUNDLE_PROMPT_PREFIX + "\n\n" + _ticker_data_section(
+        ticker, company_name, news_articles, price_data, financial_metrics
+    )
+
+
+def _batch_bundle_prompt(items: List[Dict[str, Any]]) -> str:
+    return _BATCH_BUNDLE_PROMPT_PREFIX + "\n\n" + "\n\n".join(
+        f"<TICKER id=\"{item['ticker']}\">\n"
+        + _ticker_data_section(
+            item['ticker'],
+            item['company_name'],
+            item['news_articles'],
+            item['price_data'],
+            item['financial_metrics']
+        )
+        + "\n</TICKER>"
+        for item in items
+    )
+
+
+def _parse_batch_bundle(result_text: str, requested: List[str]) -> Dict[str, Dict[str, Any]]:
+    entries = json.loads(_strip_json_fences(result_text))
+
+    results = {}
+    for entry in entries:
+        ticker = entry.get('ticker')
+        if ticker not in requested:
+            continue
+        if all(k in entry for k in ('news_summary', 'technical_analysis', 'investment_analysis')):
+            results[ticker] = {
+                'news_summary': entry['news_summary'],
+                'technical_analysis': entry['technical_analysis'],
+                'investment_analysis': entry['investment_analysis']
+            }
+
+    missing = [t for t in requested if t not in results]
+    if missing:
+        logger.warning("Batched bundle response missing tickers",
+                       missing=missing)
+    logger.info(f"Generated batched analysis bundle for {len(results)}/{len(requested)} tickers")
+    return results
+
+
+class GeminiService:
+    """Service for interacting with Google's Gemini AI API with enhanced prompts."""
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize Gemini service.
         
-        try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
+        Args:
+            api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
+        """
+        self.api_key = api_key or os.getenv('GEMINI_API_KEY') 
+
+        if not self.api_key:
+            logger.warning("GEMINI_API_KEY not found, some features may not work")
+        
+        genai.configure(api_key=self.api_key)
+        self.model = genai.GenerativeModel('gemini-2.5-flash')
+
+    def _generate(self, prompt: str, generation_config=None) -> str:
+        """Issue one blocking Gemini call and return the stripped response text."""
+        response = self.model.generate_content(
+            prompt, generation_config=generation_config
+        )
+        return response.text.strip()
+
+    async def _agenerate(self, prompt: str, generation_config=None) -> str:
+        """Issue one Gemini call on the event loop via the native async API.
+
+        generate_content_async awaits the HTTP round trip directly, so
+        concurrent analyses overlap their network waits without tying up a
+        worker thread per in-flight call the way run_in_executor does.
+        """
+        response = await self.model.generate_content_async(
+            prompt, generation_config=generation_config
+        )
+        return response.text.strip()
+
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_news_key)
+    def summarize_news(self, ticker: str, news_articles: Sequence[NewsArticle]) -> Dict[str, Any]:
+        """
+        Summarize news articles using Gemini with enhanced prompts.
+        
+        Args:
+            ticker: Stock ticker symbol
+            news_articles: NewsArticle records from the Yahoo tool
             
-            # Extract JSON from response
-            if '```json' in result_text:
-                result_text = result_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in result_text:
-                result_text = result_text.split('```')[1].split('```')[0].strip()
+        Returns:
+            Dictionary containing summary, sentiment, and key points
+        """
+        if not news_articles:
+            return _no_news_result(ticker)
+
+        try:
+            result = json.loads(_strip_json_fences(
+                self._generate(_news_prompt(ticker, news_articles))
+            ))
+            logger.info(f"Successfully summarized news for {ticker}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error summarizing news for {ticker}", error=str(e))
+            return _news_fallback(ticker, news_articles)
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_news_key)
+    async def summarize_news_async(self, ticker: str, news_articles: Sequence[NewsArticle]) -> Dict[str, Any]:
+        """Async variant of summarize_news; awaits the Gemini call natively."""
+        if not news_articles:
+            return _no_news_result(ticker)
+
+        try:
+            result = json.loads(_strip_json_fences(
+                await self._agenerate(_news_prompt(ticker, news_articles))
+            ))
+            logger.info(f"Successfully summarized news for {ticker}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error summarizing news for {ticker}", error=str(e))
+            return _news_fallback(ticker, news_articles)
+
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_bundle_key)
+    def analyze_ticker_bundle(
+        self,
+        ticker: str,
+        company_name: str,
+        news_articles: Sequence[NewsArticle],
+        price_data: Dict[str, Any],
+        financial_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run news summarization, technical analysis and investment analysis
+        in a single Gemini call.
+
+        One fused prompt replaces the three serial round trips paid by
+        summarize_news, analyze_support_resistance and
+        generate_investment_analysis; the model sees the same data once and
+        returns all three sections as typed JSON.
+
+        Args:
+            ticker: Stock ticker symbol
+            company_name: Company name
+            news_articles: NewsArticle records from the Yahoo tool
+            price_data: Price history data
+            financial_metrics: Financial metrics
+
+        Returns:
+            Dictionary with 'news_summary', 'technical_analysis' and
+            'investment_analysis' keys, each shaped like the output of the
+            corresponding single-purpose method
+        """
+        try:
+            result = json.loads(_strip_json_fences(self._generate(
+                _bundle_prompt(ticker, company_name, news_articles, price_data, financial_metrics),
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json"
+                )
+            )))
+
+            if not all(k in result for k in ('news_summary', 'technical_analysis', 'investment_analysis')):
+                raise ValueError("Incomplete bundle response")
+
+            logger.info(f"Successfully generated analysis bundle for {ticker}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error generating analysis bundle for {ticker}", error=str(e))
+            # Fall back to the single-purpose methods, which carry their own
+            # data-driven fallbacks
+            news_summary = self.summarize_news(ticker, news_articles)
+            technical_analysis = self.analyze_support_resistance(ticker, price_data)
+            investment_analysis = self.generate_investment_analysis(
+                ticker=ticker,
+                company_name=company_name,
+                news_summary=news_summary,
+                price_data=price_data,
+                financial_metrics=financial_metrics
+            )
+            return {
+                'news_summary': news_summary,
+                'technical_analysis': technical_analysis,
+                'investment_analysis': investment_analysis
+            }
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_bundle_key)
+    async def analyze_ticker_bundle_async(
+        self,
+        ticker: str,
+        company_name: str,
+        news_articles: Sequence[NewsArticle],
+        price_data: Dict[str, Any],
+        financial_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async variant of analyze_ticker_bundle.
+
+        Awaiting the fused call natively lets the orchestrator keep many
+        tickers in flight without dedicating a thread-pool worker to each
+        blocked Gemini request. On failure the three single-purpose analyses
+        run concurrently via asyncio.gather, so even the degraded path pays
+        max-of-three latency rather than sum-of-three.
+        """
+        try:
+            result = json.loads(_strip_json_fences(await self._agenerate(
+                _bundle_prompt(ticker, company_name, news_articles, price_data, financial_metrics),
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json"
+                )
+            )))
+
+            if not all(k in result for k in ('news_summary', 'technical_analysis', 'investment_analysis')):
+                raise ValueError("Incomplete bundle response")
+
+            logger.info(f"Successfully generated analysis bundle for {ticker}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error generating analysis bundle for {ticker}", error=str(e))
+            # Fall back to the single-purpose methods, run concurrently;
+            # each carries its own data-driven fallback
+            news_summary, technical_analysis = await asyncio.gather(
+                self.summarize_news_async(ticker, news_articles),
+                self.analyze_support_resistance_async(ticker, price_data)
+            )
+            investment_analysis = await self.generate_investment_analysis_async(
+                ticker=ticker,
+                company_name=company_name,
+                news_summary=news_summary,
+                price_data=price_data,
+                financial_metrics=financial_metrics
+            )
+            return {
+                'news_summary': news_summary,
+                'technical_analysis': technical_analysis,
+                'investment_analysis': investment_analysis
+            }
+
+    def analyze_ticker_bundle_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the full analysis bundle for several tickers in one Gemini call.
+
+        Each Gemini round trip is latency-dominated, not compute-dominated,
+        so folding up to BATCH_CHUNK_SIZE tickers into a single prompt cuts
+        the request count (and wall clock) roughly K-fold for multi-ticker
+        queries. Callers pass chunks of at most BATCH_CHUNK_SIZE items to
+        stay within output token limits.
+
+        Args:
+            items: List of dicts, each with 'ticker', 'company_name',
+                'news_articles', 'price_data' and 'financial_metrics' keys
+                (the analyze_ticker_bundle arguments by name)
+
+        Returns:
+            Dictionary mapping ticker -> bundle result shaped like the output
+            of analyze_ticker_bundle. Tickers the model failed to cover are
+            absent, and a failed call returns an empty dict; callers fall
+            back to analyze_ticker_bundle per missing ticker.
+        """
+        if not items:
+            return {}
+
+        requested = [item['ticker'] for item in items]
+        try:
+            result_text = self._generate(
+                _batch_bundle_prompt(items),
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json"
+                )
+            )
+            return _parse_batch_bundle(result_text, requested)
+
+        except Exception as e:
+            logger.error("Error generating batched analysis bundle",
+                         tickers=requested, error=str(e))
+            return {}
+
+    async def analyze_ticker_bundle_batch_async(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async variant of analyze_ticker_bundle_batch.
+
+        Chunks of a multi-ticker query can be gathered concurrently without
+        borrowing threads from the executor pool; semantics otherwise match
+        the sync method, including the empty-dict return on failure.
+        """
+        if not items:
+            return {}
+
+        requested = [item['ticker'] for item in items]
+        try:
+            result_text = await self._agenerate(
+                _batch_bundle_prompt(items),
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json"
+                )
+            )
+            return _parse_batch_bundle(result_text, requested)
+
+        except Exception as e:
+            logger.error("Error generating batched analysis bundle",
+                         tickers=requested, error=str(e))
+            return {}
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_analysis_key)
+    def generate_investment_analysis(
+        self,
+        ticker: str,
+        company_name: str,
+        news_summary: Dict[str, Any],
+        price_data: Dict[str, Any],
+        financial_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Generate comprehensive investment analysis using Gemini with enhanced prompts.
+        
+        Args:
+            ticker: Stock ticker symbol
+            company_name: Company name
+            news_summary: Summarized news data
+            price_data: Price and technical data
+            financial_metrics: Financial metrics
             
-            result = json.loads(result_text)
+        Returns:
+            Dictionary containing detailed investment analysis
+        """
+        try:
+            result = json.loads(_strip_json_fences(self._generate(
+                _analysis_prompt(ticker, company_name, news_summary, price_data, financial_metrics)
+            )))
             logger.info(f"Successfully generated investment analysis for {ticker}")
             return result
-            
+
         except Exception as e:
             logger.error(f"Error generating investment analysis for {ticker}", error=str(e))
-            # Enhanced fallback with more specific content
-            trend = price_data.get('trend', 'neutral')
-            current_price = price_data.get('current_price', 0)
-            high_52w = price_data.get('high_52w', 0) or financial_metrics.get('fifty_two_week_high', 0)
-            low_52w = price_data.get('low_52w', 0) or financial_metrics.get('fifty_two_week_low', 0)
-            
-            if high_52w and low_52w and current_price:
-                price_change = ((current_price - low_52w) / low_52w) * 100
-            else:
-                price_change = 0
-            
-            sentiment = news_summary.get('sentiment', 'neutral')
-            pe_ratio = financial_metrics.get('pe_ratio', 0)
-            profit_margin = financial_metrics.get('profit_margin', 0)
-            
-            # Determine stance based on data
-            if trend == 'bullish' and sentiment == 'positive' and price_change > 5:
-                stance = 'buy'
-                confidence = 'medium'
-            elif trend == 'bearish' and sentiment == 'negative' and price_change < -5:
-                stance = 'sell'
-                confidence = 'medium'
-            else:
-                stance = 'hold'
-                confidence = 'medium'
-            
-            # Format revenue growth for fallback message
-            if revenue_growth is None or revenue_growth_value == 0:
-                revenue_growth_text = "with revenue growth data unavailable"
-            else:
-                revenue_growth_text = f"with {revenue_growth_value*100:.1f}% revenue growth"
-            
-            return {
-                'rationale': f'{company_name} ({ticker}) demonstrates a {trend} technical trend with {sentiment} market sentiment. The stock has moved {abs(price_change):.1f}% from its 52-week low, trading at a P/E ratio of {pe_ratio:.1f}x. Based on current fundamentals including {profit_margin*100:.1f}% profit margins, the company maintains a stable market position. The investment outlook suggests a {stance} recommendation with {confidence} confidence given the current market dynamics and company-specific factors.',
-                'key_drivers': [
-                    f'Profit margin of {profit_margin*100:.1f}% demonstrating strong operational efficiency',
-                    f'P/E ratio of {pe_ratio:.1f}x indicating market valuation relative to earnings',
-                    'Strategic market positioning and competitive advantages in core business segments',
-                    'Innovation pipeline and product development initiatives driving future growth',
-                    'Brand strength and customer loyalty supporting pricing power'
-                ],
-                'risks': [
-                    f'Current P/E ratio of {pe_ratio:.1f}x may indicate valuation concerns',
-                    'Macroeconomic headwinds including interest rate environment and inflation pressures',
-                    'Competitive intensity in key markets potentially impacting market share',
-                    'Regulatory environment changes that could affect business operations',
-                    'Limited revenue growth visibility requiring close monitoring of business trends'
-                ],
-                'catalysts': [
-                    'Next quarterly earnings announcement expected to provide updated guidance',
-                    'Upcoming product launches and service expansions in key markets',
-                    'Potential strategic partnerships or M&A activity to enhance market position',
-                    'Industry conference presentations and investor day events',
-                    'Analyst day or capital markets day with long-term financial targets'
-                ],
-                'stance': stance,
-                'confidence': confidence,
-                'confidence_rationale': f'Confidence level is {confidence} based on the {trend} price trend, {sentiment} news sentiment, and {abs(price_change):.1f}% price movement. The analysis incorporates available financial metrics {revenue_growth_text}, though some uncertainty remains regarding near-term catalysts and market conditions.'
-            }
-    
+            return _analysis_fallback(ticker, company_name, news_summary, price_data, financial_metrics)
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_analysis_key)
+    async def generate_investment_analysis_async(
+        self,
+        ticker: str,
+        company_name: str,
+        news_summary: Dict[str, Any],
+        price_data: Dict[str, Any],
+        financial_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async variant of generate_investment_analysis."""
+        try:
+            result = json.loads(_strip_json_fences(await self._agenerate(
+                _analysis_prompt(ticker, company_name, news_summary, price_data, financial_metrics)
+            )))
+            logger.info(f"Successfully generated investment analysis for {ticker}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error generating investment analysis for {ticker}", error=str(e))
+            return _analysis_fallback(ticker, company_name, news_summary, price_data, financial_metrics)
+
+
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_price_key)
     def analyze_support_resistance(self, ticker: str, price_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze support and resistance levels using Gemini.
@@ -330,47 +918,27 @@ Respond with ONLY the JSON, no additional text."""
         Returns:
             Dictionary containing support/resistance analysis
         """
-        prompt = f"""You are a professional technical analyst. Analyze the price levels for {ticker}:
-
-Current Price: ${price_data.get('current_price', 0):.2f}
-52-Week High: ${price_data.get('high_52w', 0):.2f}
-52-Week Low: ${price_data.get('low_52w', 0):.2f}
-Trend: {price_data.get('trend', 'neutral')}
-20-Day MA: ${price_data.get('ma_20', 0):.2f}
-50-Day MA: ${price_data.get('ma_50', 0):.2f}
-
-Recent Resistance Levels: {', '.join([f'${x:.2f}' for x in price_data.get('resistance_levels', [])])}
-Recent Support Levels: {', '.join([f'${x:.2f}' for x in price_data.get('support_levels', [])])}
+        try:
+            result = json.loads(_strip_json_fences(
+                self._generate(_technical_prompt(ticker, price_data))
+            ))
+            logger.info(f"Successfully analyzed support/resistance for {ticker}")
+            return result
 
-Provide technical analysis in JSON format:
-{{
-    "support_levels": [level1, level2, level3],
-    "resistance_levels": [level1, level2, level3],
-    "technical_summary": "2-3 sentence technical summary with specific price levels and trend analysis"
-}}
+        except Exception as e:
+            logger.error(f"Error analyzing support/resistance for {ticker}", error=str(e))
+            return _technical_fallback(ticker, price_data)
 
-Respond with ONLY the JSON, no additional text."""
-        
+    @_ttl_hash_cache(maxsize=2048, ttl=300, make_key=_price_key)
+    async def analyze_support_resistance_async(self, ticker: str, price_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of analyze_support_resistance."""
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-            
-            # Extract JSON from response
-            if '```json' in result_text:
-                result_text = result_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in result_text:
-                result_text = result_text.split('```')[1].split('```')[0].strip()
-            
-            result = json.loads(result_text)
+            result = json.loads(_strip_json_fences(
+                await self._agenerate(_technical_prompt(ticker, price_data))
+            ))
             logger.info(f"Successfully analyzed support/resistance for {ticker}")
             return result
-            
+
         except Exception as e:
             logger.error(f"Error analyzing support/resistance for {ticker}", error=str(e))
-            current_price = price_data.get('current_price', 0)
-            trend = price_data.get('trend', 'neutral')
-            return {
-                'support_levels': price_data.get('support_levels', [])[:3],
-                'resistance_levels': price_data.get('resistance_levels', [])[:3],
-                'technical_summary': f'{ticker} is currently trading at ${current_price:.2f} in a {trend} trend. The stock is positioned between key support levels at {", ".join([f"${x:.2f}" for x in price_data.get("support_levels", [])[:2]])} and resistance at {", ".join([f"${x:.2f}" for x in price_data.get("resistance_levels", [])[:2]])}. Technical indicators suggest monitoring these levels for potential breakout or breakdown signals.'
-            }
\ No newline at end of file
+            return _technical_fallback(ticker, price_data)
\ No newline at end of file
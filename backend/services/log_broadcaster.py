@@ -44,7 +44,11 @@ class LogBroadcaster:
         self.request_id = request_id
         self.connection_manager = connection_manager
         self._enabled = connection_manager is not None
-    
+        # Bounded queue drained by a single background task so WebSocket
+        # sends (and readability delays) never stall the analysis pipeline
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+
     async def emit(
         self,
         event_type: LogEventType,
@@ -78,19 +82,45 @@ class LogBroadcaster:
         if details:
             log_event["details"] = details
         
-        try:
-            await self.connection_manager.broadcast(self.request_id, log_event)
-            logger.debug("Log event emitted", 
-                        request_id=self.request_id,
-                        event_type=event_type.value)
-        except Exception as e:
-            logger.error("Failed to emit log event", 
-                        request_id=self.request_id,
-                        error=str(e))
-        
-        if delay > 0:
-            await asyncio.sleep(delay)
-    
+        # Enqueue and return immediately instead of awaiting the WebSocket
+        # round trip; a slow client can no longer serialize the per-ticker
+        # pipeline. One drain task per broadcaster preserves ordering, and
+        # the pacing delays happen on the consumer side.
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=256)
+
+        if self._queue.full():
+            # Drop the oldest event; progress messages are ephemeral
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait((log_event, delay))
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        """Send queued events in order until the queue empties."""
+        while True:
+            try:
+                log_event, delay = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                await self.connection_manager.broadcast(self.request_id, log_event)
+                logger.debug("Log event emitted",
+                            request_id=self.request_id,
+                            event_type=log_event["type"])
+            except Exception as e:
+                logger.error("Failed to emit log event",
+                            request_id=self.request_id,
+                            error=str(e))
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
     # ========== User-Facing Progress Messages ==========
     
     async def query_received(self, query: str):
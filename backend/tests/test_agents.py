@@ -268,8 +268,8 @@ class TestIntegration:
         """Test synthesis agent with mock agent results."""
         synthesis_agent = SynthesisAgent(self.mock_llm)
         
-        # Mock LLM responses for analysis and recommendation
-        analysis_response = Mock(content="""
+        # Mock LLM response covering analysis and recommendation in one call
+        insight_response = Mock(content="""
         SUMMARY: Strong performance with good prospects.
         KEY_DRIVERS:
         - Revenue growth
@@ -278,15 +278,13 @@ class TestIntegration:
         - Competition
         CATALYSTS:
         - New products
-        """)
-        
-        recommendation_response = Mock(content="""
         STANCE: BUY
         CONFIDENCE: HIGH
         RATIONALE: Strong fundamentals support buy recommendation.
         """)
-        
-        self.mock_llm.ainvoke.side_effect = [analysis_response, recommendation_response]
+
+        # The agent's default shared batcher funnels the call through abatch
+        self.mock_llm.abatch = AsyncMock(return_value=[insight_response])
         
         # Mock agent results
         agent_results = {
@@ -245,10 +245,19 @@ class TestTickerMapper:
         
         mapper = get_ticker_mapper()
         tickers, unresolved = mapper.extract_tickers_from_query("Compare Apple Microsoft and Google")
-        
+
         # Should find at least some of these
         assert len(tickers) > 0
 
+    def test_ticker_mapper_preserves_order(self):
+        """Test that extraction keeps the order tickers appear in the query."""
+        from backend.services.ticker_mapper import get_ticker_mapper
+
+        mapper = get_ticker_mapper()
+        tickers, unresolved = mapper.extract_tickers_from_query("Compare MSFT with AAPL and MSFT again")
+
+        assert tickers == ["MSFT", "AAPL"]
+
 
 class TestFormatters:
     """Test cases for formatting utilities."""
@@ -0,0 +1,64 @@
+"""
+Tests for the WebSocket streaming-log endpoint and broadcast fan-out.
+"""
+import orjson
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+from backend.app.websocket import ConnectionManager, get_connection_manager
+
+
+class TestWebSocketBroadcast:
+    """Round-trip tests through the /ws/{request_id} endpoint."""
+
+    def test_broadcast_round_trip(self):
+        """A broadcast arrives as one binary frame of UTF-8 JSON."""
+        request_id = "test-ws-round-trip"
+        manager = get_connection_manager()
+
+        with TestClient(app) as client:
+            with client.websocket_connect(f"/ws/{request_id}") as websocket:
+                assert manager.get_connection_count(request_id) == 1
+
+                client.portal.call(
+                    manager.broadcast,
+                    request_id,
+                    {"type": "info", "message": "hello"},
+                )
+
+                # Frames are binary (orjson bytes); clients decode the UTF-8
+                # payload before JSON-parsing, as useWebSocketLogs.js does
+                event = orjson.loads(websocket.receive_bytes())
+                assert event["type"] == "info"
+                assert event["message"] == "hello"
+                assert "timestamp" in event
+
+            assert manager.get_connection_count(request_id) == 0
+
+    def test_broadcast_fans_out_to_all_connections(self):
+        """Every subscriber on a request_id receives the same payload."""
+        request_id = "test-ws-fan-out"
+        manager = get_connection_manager()
+
+        with TestClient(app) as client:
+            with client.websocket_connect(f"/ws/{request_id}") as first, \
+                 client.websocket_connect(f"/ws/{request_id}") as second:
+                client.portal.call(
+                    manager.broadcast,
+                    request_id,
+                    {"type": "info", "message": "fan-out"},
+                )
+
+                for websocket in (first, second):
+                    event = orjson.loads(websocket.receive_bytes())
+                    assert event["message"] == "fan-out"
+
+    def test_broadcast_without_connections_is_noop(self):
+        """Broadcasting to an unknown request_id does nothing."""
+        manager = ConnectionManager()
+
+        with TestClient(app) as client:
+            client.portal.call(
+                manager.broadcast, "nobody-listening", {"type": "info"}
+            )
+        assert manager.get_connection_count("nobody-listening") == 0
@@ -0,0 +1,50 @@
+"""
+Shared HTTP session for agent tools.
+"""
+from typing import Optional
+
+import aiohttp
+import structlog
+
+logger = structlog.get_logger()
+
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide aiohttp session, creating it lazily.
+
+    A single pooled session keeps TCP/TLS connections alive across all
+    agents and tools, so repeated requests to the same hosts reuse
+    warm connections instead of paying a handshake per agent per ticker.
+
+    Returns:
+        The shared aiohttp client session
+    """
+    global _shared_session
+
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=16,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+        )
+        logger.info("Created shared HTTP session")
+
+    return _shared_session
+
+
+async def close_shared_session():
+    """Close the shared session. Called at application shutdown."""
+    global _shared_session
+
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+        logger.info("Closed shared HTTP session")
+
+    _shared_session = None
@@ -8,34 +8,31 @@ from typing import Dict, Any, List
 import structlog
 
 from backend.tools.base_tool import BaseTool
+from backend.tools.http import get_shared_session
 
 logger = structlog.get_logger()
 
 
 class SECEdgarTool(BaseTool):
     """Tool for searching SEC EDGAR database for regulatory filings."""
-    
+
     def __init__(self):
         super().__init__(
             name="sec_edgar",
             description="Search SEC EDGAR database for regulatory filings like 10-K, 10-Q, 8-K reports"
         )
         self.base_url = "https://www.sec.gov/Archives/edgar"
-        self.session = None
-    
+        # Per-request settings applied on top of the shared pooled session
+        self.timeout = aiohttp.ClientTimeout(total=15)
+        self.headers = {
+            'User-Agent': 'Stock Research Chatbot (research@example.com)',
+            'Accept': 'application/json, text/html',
+            'Host': 'www.sec.gov'
+        }
+
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an HTTP session with proper headers for SEC.gov."""
-        if self.session is None or self.session.closed:
-            headers = {
-                'User-Agent': 'Stock Research Chatbot (research@example.com)',
-                'Accept': 'application/json, text/html',
-                'Host': 'www.sec.gov'
-            }
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=15),
-                headers=headers
-            )
-        return self.session
+        """Get the shared pooled HTTP session."""
+        return get_shared_session()
     
     async def execute(self, query: str, ticker: str) -> Dict[str, Any]:
         """
@@ -177,6 +174,5 @@ class SECEdgarTool(BaseTool):
         return sources
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op; the shared session is closed at application shutdown."""
+        pass
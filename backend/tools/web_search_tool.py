@@ -9,30 +9,28 @@ from urllib.parse import quote_plus
 import structlog
 
 from backend.tools.base_tool import BaseTool
+from backend.tools.http import get_shared_session
 
 logger = structlog.get_logger()
 
 
 class WebSearchTool(BaseTool):
     """Tool for searching the web and extracting relevant information."""
-    
+
     def __init__(self):
         super().__init__(
             name="web_search",
             description="Search the web for recent information about stocks, companies, and financial topics"
         )
-        self.session = None
-    
+        # Per-request settings applied on top of the shared pooled session
+        self.timeout = aiohttp.ClientTimeout(total=10)
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an HTTP session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-            )
-        return self.session
+        """Get the shared pooled HTTP session."""
+        return get_shared_session()
     
     async def execute(self, query: str, ticker: str) -> Dict[str, Any]:
         """
@@ -146,6 +144,5 @@ class WebSearchTool(BaseTool):
         return sources
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op; the shared session is closed at application shutdown."""
+        pass
@@ -1,6 +1,13 @@
 """
 Improved Yahoo Finance Tool - Fetches real-time stock data using Manus API Hub and web scraping.
 """
+import asyncio
+
+import aiohttp
+import cachetools
+from collections import namedtuple
+
+from backend.tools.http import get_shared_session
 from backend.utils.api_client import ApiClient
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -12,14 +19,50 @@ import re
 
 logger = structlog.get_logger()
 
+# Lightweight immutable article record; cheaper to allocate than a dict and
+# safe to share across the caches and concurrent ticker tasks
+NewsArticle = namedtuple('NewsArticle', 'url title publisher published_at snippet')
+
 
 class YahooFinanceTool:
     """Tool for fetching stock data and news from Yahoo Finance using Manus API Hub."""
-    
+
+    _HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    _TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+    # Quote-type data moves fast, fundamentals don't; polling dashboards
+    # re-request the same tickers every few seconds. Class-level so the
+    # caches outlive the per-request tool instances the orchestrator builds.
+    _info_cache = cachetools.TTLCache(maxsize=2048, ttl=60)
+    _metrics_cache = cachetools.TTLCache(maxsize=2048, ttl=86400)
+
     def __init__(self):
         self.api_client = ApiClient()
-        self.cache = {}
-        self.cache_duration = timedelta(minutes=5)
+
+    async def _fetch_chart(self, ticker: str, period: str = '1mo') -> Dict[str, Any]:
+        """Fetch chart JSON from the Yahoo quote API over the shared session."""
+        session = get_shared_session()
+        url = f'https://query1.finance.yahoo.com/v8/finance/chart/{ticker}'
+        params = {
+            'interval': '1d',
+            'range': period,
+            'includeAdjustedClose': 'true'
+        }
+        async with session.get(url, params=params, headers=self._HEADERS,
+                               timeout=self._TIMEOUT) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def _fetch_quote_page(self, ticker: str) -> str:
+        """Fetch the Yahoo Finance quote page HTML over the shared session."""
+        session = get_shared_session()
+        url = f'https://finance.yahoo.com/quote/{ticker}'
+        async with session.get(url, headers=self._HEADERS,
+                               timeout=self._TIMEOUT) as response:
+            response.raise_for_status()
+            return await response.text()
     
     def _scrape_yahoo_finance_data(self, ticker: str) -> Dict[str, Any]:
         """
@@ -33,18 +76,23 @@ class YahooFinanceTool:
         """
         try:
             url = f'https://finance.yahoo.com/quote/{ticker}'
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = requests.get(url, headers=self._HEADERS, timeout=10)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+
+            return self._parse_quote_metrics(ticker, response.text)
+
+        except Exception as e:
+            logger.warning(f"Error scraping Yahoo Finance data for {ticker}", error=str(e))
+            return {}
+
+    def _parse_quote_metrics(self, ticker: str, html: str) -> Dict[str, Any]:
+        """Parse financial metrics out of quote page HTML."""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             text = soup.get_text()
-            
+
             data = {}
-            
+
             # Extract PE Ratio
             pe_patterns = [
                 r'PE Ratio \(TTM\)[^\d]+([\d.]+)',
@@ -112,9 +160,9 @@ class YahooFinanceTool:
             
             logger.info(f"Scraped data for {ticker}", data=data)
             return data
-            
+
         except Exception as e:
-            logger.warning(f"Error scraping Yahoo Finance data for {ticker}", error=str(e))
+            logger.warning(f"Error parsing Yahoo Finance data for {ticker}", error=str(e))
             return {}
     
     def get_stock_info(self, ticker: str) -> Dict[str, Any]:
@@ -127,6 +175,11 @@ class YahooFinanceTool:
         Returns:
             Dictionary containing stock information
         """
+        key = ticker.upper()
+        cached = self._info_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Fetch stock chart data which includes comprehensive info
             response = self.api_client.call_api('YahooFinance/get_stock_chart', query={
@@ -138,49 +191,93 @@ class YahooFinanceTool:
                 'events': 'div,split'
             })
             
-            if not response or 'chart' not in response or 'result' not in response['chart']:
-                logger.error(f"Invalid response for {ticker}")
-                raise Exception("Invalid API response")
-            
-            result = response['chart']['result'][0]
-            meta = result.get('meta', {})
-            
-            # Extract current price
-            current_price = meta.get('regularMarketPrice')
-            if not current_price:
-                logger.error(f"No price data available for {ticker}")
-                raise Exception("No price data available")
-            
             # Scrape additional data from Yahoo Finance webpage
             scraped_data = self._scrape_yahoo_finance_data(ticker)
-            
-            # Get company info
-            company_name = meta.get('longName', ticker)
-            
-            result_data = {
+
+            result_data = self._build_stock_info(ticker, response, scraped_data)
+            self._info_cache[key] = result_data
+            return result_data
+
+        except Exception as e:
+            logger.error(f"Error fetching stock info for {ticker}", error=str(e))
+            return {
                 'ticker': ticker,
-                'company_name': company_name,
-                'sector': 'Unknown',
-                'industry': 'Unknown',
-                'current_price': float(current_price),
-                'market_cap': scraped_data.get('market_cap', 0),
-                'pe_ratio': scraped_data.get('pe_ratio'),
-                'eps': scraped_data.get('eps', 0),
-                'revenue_growth': scraped_data.get('revenue_growth', 0),
-                'profit_margin': scraped_data.get('profit_margin', 0),
-                'fifty_two_week_high': meta.get('fiftyTwoWeekHigh', 0),
-                'fifty_two_week_low': meta.get('fiftyTwoWeekLow', 0),
-                'analyst_recommendation': 'hold',
-                'target_price': 0,
+                'error': f"Failed to fetch data for {ticker}: {str(e)}",
+                'company_name': ticker,
+                'current_price': None,
+                'pe_ratio': None,
             }
-            
-            logger.info(f"Successfully fetched stock info for {ticker}", 
-                       price=result_data['current_price'], 
-                       pe_ratio=result_data['pe_ratio'],
-                       market_cap=result_data['market_cap'])
-            
+
+    def _build_stock_info(
+        self,
+        ticker: str,
+        response: Dict[str, Any],
+        scraped_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble the stock info dict from chart JSON and scraped metrics."""
+        if not response or 'chart' not in response or 'result' not in response['chart']:
+            logger.error(f"Invalid response for {ticker}")
+            raise Exception("Invalid API response")
+
+        result = response['chart']['result'][0]
+        meta = result.get('meta', {})
+
+        # Extract current price
+        current_price = meta.get('regularMarketPrice')
+        if not current_price:
+            logger.error(f"No price data available for {ticker}")
+            raise Exception("No price data available")
+
+        # Get company info
+        company_name = meta.get('longName', ticker)
+
+        result_data = {
+            'ticker': ticker,
+            'company_name': company_name,
+            'sector': 'Unknown',
+            'industry': 'Unknown',
+            'current_price': float(current_price),
+            'market_cap': scraped_data.get('market_cap', 0),
+            'pe_ratio': scraped_data.get('pe_ratio'),
+            'eps': scraped_data.get('eps', 0),
+            'revenue_growth': scraped_data.get('revenue_growth', 0),
+            'profit_margin': scraped_data.get('profit_margin', 0),
+            'fifty_two_week_high': meta.get('fiftyTwoWeekHigh', 0),
+            'fifty_two_week_low': meta.get('fiftyTwoWeekLow', 0),
+            'analyst_recommendation': 'hold',
+            'target_price': 0,
+        }
+
+        logger.info(f"Successfully fetched stock info for {ticker}",
+                   price=result_data['current_price'],
+                   pe_ratio=result_data['pe_ratio'],
+                   market_cap=result_data['market_cap'])
+
+        return result_data
+
+    async def get_stock_info_async(self, ticker: str) -> Dict[str, Any]:
+        """
+        Async variant of get_stock_info using the shared aiohttp session.
+
+        The chart JSON and quote page are fetched concurrently over pooled
+        keep-alive connections instead of serial blocking requests.
+        """
+        key = ticker.upper()
+        cached = self._info_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            response, quote_html = await asyncio.gather(
+                self._fetch_chart(ticker, '1mo'),
+                self._fetch_quote_page(ticker)
+            )
+            scraped_data = self._parse_quote_metrics(ticker, quote_html)
+
+            result_data = self._build_stock_info(ticker, response, scraped_data)
+            self._info_cache[key] = result_data
             return result_data
-            
+
         except Exception as e:
             logger.error(f"Error fetching stock info for {ticker}", error=str(e))
             return {
@@ -190,130 +287,144 @@ class YahooFinanceTool:
                 'current_price': None,
                 'pe_ratio': None,
             }
-    
-    def get_news(self, ticker: str, limit: int = 10) -> List[Dict[str, Any]]:
+
+    def get_news(self, ticker: str, limit: int = 10) -> List[NewsArticle]:
         """
         Get recent news articles for a stock by scraping Yahoo Finance.
-        
+
         Args:
             ticker: Stock ticker symbol
             limit: Maximum number of news articles to return
-            
+
         Returns:
-            List of news articles with metadata
+            List of NewsArticle records
         """
         try:
             url = f'https://finance.yahoo.com/quote/{ticker}'
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = requests.get(url, headers=self._HEADERS, timeout=10)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles = []
-            
-            # Find news articles in the page
-            # Yahoo Finance typically has news in specific sections
-            news_items = soup.find_all(['h3', 'h4'], limit=limit * 2)
-            
-            for item in news_items:
-                try:
-                    # Find the link
-                    link = item.find('a')
-                    if not link:
-                        continue
-                    
-                    title = link.get_text(strip=True)
-                    href = link.get('href', '')
-                    
-                    # Make sure it's a valid news link
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    # Filter out irrelevant sections
-                    irrelevant_keywords = ['entertainment', 'sports', 'weather', 'lifestyle', 'celebrity', 'horoscope']
-                    if any(keyword in title.lower() for keyword in irrelevant_keywords):
-                        continue
-                    if any(keyword in href.lower() for keyword in irrelevant_keywords):
-                        continue
-                    
-                    # Construct full URL
-                    if href.startswith('/'):
-                        full_url = f'https://finance.yahoo.com{href}'
-                    elif href.startswith('http'):
-                        full_url = href
-                    else:
-                        continue
-                    
-                    # Skip duplicate titles
-                    if any(a['title'] == title for a in articles):
-                        continue
-                    
-                    articles.append({
-                        'url': full_url,
-                        'title': title,
-                        'publisher': 'Yahoo Finance',
-                        'published_at': datetime.now(),
-                        'snippet': title,  # Use title as snippet
-                        'thumbnail': ''
-                    })
-                    
-                    if len(articles) >= limit:
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Error parsing news item", error=str(e))
-                    continue
-            
-            # If we didn't find enough news, add some generic items
-            if len(articles) < 3:
-                logger.info(f"Only found {len(articles)} news articles for {ticker}, adding generic items")
-                generic_news = [
-                    {
-                        'url': f'https://finance.yahoo.com/quote/{ticker}',
-                        'title': f'{ticker} stock analysis and market trends',
-                        'publisher': 'Yahoo Finance',
-                        'published_at': datetime.now(),
-                        'snippet': f'Current market analysis and trading information for {ticker}',
-                        'thumbnail': ''
-                    },
-                    {
-                        'url': f'https://finance.yahoo.com/quote/{ticker}/news',
-                        'title': f'Latest {ticker} company news and updates',
-                        'publisher': 'Yahoo Finance',
-                        'published_at': datetime.now(),
-                        'snippet': f'Recent developments and news coverage for {ticker}',
-                        'thumbnail': ''
-                    },
-                    {
-                        'url': f'https://finance.yahoo.com/quote/{ticker}/analysis',
-                        'title': f'{ticker} analyst ratings and price targets',
-                        'publisher': 'Yahoo Finance',
-                        'published_at': datetime.now(),
-                        'snippet': f'Analyst consensus and investment recommendations for {ticker}',
-                        'thumbnail': ''
-                    }
-                ]
-                articles.extend(generic_news[:limit - len(articles)])
-            
-            logger.info(f"Fetched {len(articles)} news articles for {ticker}")
-            return articles[:limit]
-            
+
+            return self._parse_news_page(ticker, response.text, limit)
+
         except Exception as e:
             logger.error(f"Error fetching news for {ticker}", error=str(e))
             # Return generic news as fallback
             return [
-                {
-                    'url': f'https://finance.yahoo.com/quote/{ticker}',
-                    'title': f'{ticker} stock market data and analysis',
-                    'publisher': 'Yahoo Finance',
-                    'published_at': datetime.now(),
-                    'snippet': f'View current stock price, charts, and market data for {ticker}',
-                    'thumbnail': ''
-                }
+                NewsArticle(
+                    url=f'https://finance.yahoo.com/quote/{ticker}',
+                    title=f'{ticker} stock market data and analysis',
+                    publisher='Yahoo Finance',
+                    published_at=datetime.now(),
+                    snippet=f'View current stock price, charts, and market data for {ticker}'
+                )
             ]
+
+    async def get_news_async(self, ticker: str, limit: int = 10) -> List[NewsArticle]:
+        """Async variant of get_news using the shared aiohttp session."""
+        try:
+            quote_html = await self._fetch_quote_page(ticker)
+            return self._parse_news_page(ticker, quote_html, limit)
+
+        except Exception as e:
+            logger.error(f"Error fetching news for {ticker}", error=str(e))
+            # Return generic news as fallback
+            return [
+                NewsArticle(
+                    url=f'https://finance.yahoo.com/quote/{ticker}',
+                    title=f'{ticker} stock market data and analysis',
+                    publisher='Yahoo Finance',
+                    published_at=datetime.now(),
+                    snippet=f'View current stock price, charts, and market data for {ticker}'
+                )
+            ]
+
+    def _parse_news_page(self, ticker: str, html: str, limit: int) -> List[NewsArticle]:
+        """Parse news articles out of quote page HTML."""
+        soup = BeautifulSoup(html, 'html.parser')
+        articles = []
+            
+        # Find news articles in the page
+        # Yahoo Finance typically has news in specific sections
+        news_items = soup.find_all(['h3', 'h4'], limit=limit * 2)
+
+        for item in news_items:
+            try:
+                # Find the link
+                link = item.find('a')
+                if not link:
+                    continue
+
+                title = link.get_text(strip=True)
+                href = link.get('href', '')
+
+                # Make sure it's a valid news link
+                if not title or len(title) < 10:
+                    continue
+
+                # Filter out irrelevant sections
+                irrelevant_keywords = ['entertainment', 'sports', 'weather', 'lifestyle', 'celebrity', 'horoscope']
+                if any(keyword in title.lower() for keyword in irrelevant_keywords):
+                    continue
+                if any(keyword in href.lower() for keyword in irrelevant_keywords):
+                    continue
+
+                # Construct full URL
+                if href.startswith('/'):
+                    full_url = f'https://finance.yahoo.com{href}'
+                elif href.startswith('http'):
+                    full_url = href
+                else:
+                    continue
+
+                # Skip duplicate titles
+                if any(a.title == title for a in articles):
+                    continue
+
+                articles.append(NewsArticle(
+                    url=full_url,
+                    title=title,
+                    publisher='Yahoo Finance',
+                    published_at=datetime.now(),
+                    snippet=title  # Use title as snippet
+                ))
+
+                if len(articles) >= limit:
+                    break
+
+            except Exception as e:
+                logger.warning(f"Error parsing news item", error=str(e))
+                continue
+
+        # If we didn't find enough news, add some generic items
+        if len(articles) < 3:
+            logger.info(f"Only found {len(articles)} news articles for {ticker}, adding generic items")
+            generic_news = [
+                NewsArticle(
+                    url=f'https://finance.yahoo.com/quote/{ticker}',
+                    title=f'{ticker} stock analysis and market trends',
+                    publisher='Yahoo Finance',
+                    published_at=datetime.now(),
+                    snippet=f'Current market analysis and trading information for {ticker}'
+                ),
+                NewsArticle(
+                    url=f'https://finance.yahoo.com/quote/{ticker}/news',
+                    title=f'Latest {ticker} company news and updates',
+                    publisher='Yahoo Finance',
+                    published_at=datetime.now(),
+                    snippet=f'Recent developments and news coverage for {ticker}'
+                ),
+                NewsArticle(
+                    url=f'https://finance.yahoo.com/quote/{ticker}/analysis',
+                    title=f'{ticker} analyst ratings and price targets',
+                    publisher='Yahoo Finance',
+                    published_at=datetime.now(),
+                    snippet=f'Analyst consensus and investment recommendations for {ticker}'
+                )
+            ]
+            articles.extend(generic_news[:limit - len(articles)])
+
+        logger.info(f"Fetched {len(articles)} news articles for {ticker}")
+        return articles[:limit]
     
     def get_price_history(self, ticker: str, period: str = '1mo') -> Dict[str, Any]:
         """
@@ -334,69 +445,119 @@ class YahooFinanceTool:
                 'range': period,
                 'includeAdjustedClose': True
             })
-            
-            if not response or 'chart' not in response or 'result' not in response['chart']:
-                raise Exception("Invalid API response")
-            
-            result = response['chart']['result'][0]
-            meta = result.get('meta', {})
-            timestamps = result.get('timestamp', [])
-            indicators = result.get('indicators', {})
-            quotes = indicators.get('quote', [{}])[0]
-            
-            # Get closing prices
-            close_prices = quotes.get('close', [])
-            
-            # Filter out None values
-            valid_prices = [p for p in close_prices if p is not None]
-            
-            if not valid_prices:
-                raise Exception("No valid price data")
-            
-            # Calculate moving averages
-            ma_20 = sum(valid_prices[-20:]) / min(20, len(valid_prices)) if len(valid_prices) >= 1 else valid_prices[-1]
-            ma_50 = sum(valid_prices[-50:]) / min(50, len(valid_prices)) if len(valid_prices) >= 1 else valid_prices[-1]
-            
-            # Calculate support and resistance levels
-            recent_prices = valid_prices[-30:] if len(valid_prices) >= 30 else valid_prices
-            current_price = valid_prices[-1]
-            
-            # Support levels (recent lows)
-            sorted_prices = sorted(recent_prices)
-            support_levels = sorted_prices[:3]
-            
-            # Resistance levels (recent highs)
-            resistance_levels = sorted_prices[-3:][::-1]
-            
-            # Determine trend
-            if ma_20 > ma_50 * 1.02:
-                trend = 'bullish'
-            elif ma_20 < ma_50 * 0.98:
-                trend = 'bearish'
-            else:
-                trend = 'neutral'
-            
+
+            return self._build_price_history(ticker, period, response)
+
+        except Exception as e:
+            logger.error(f"Error fetching price history for {ticker}", error=str(e))
             return {
                 'ticker': ticker,
-                'period': period,
-                'current_price': current_price,
-                'ma_20': ma_20,
-                'ma_50': ma_50,
-                'support_levels': support_levels,
-                'resistance_levels': resistance_levels,
-                'trend': trend,
-                'high': max(valid_prices),
-                'low': min(valid_prices),
-                'volume': sum(quotes.get('volume', [0])),
+                'error': f"Failed to fetch price history: {str(e)}"
             }
-            
+
+    async def get_price_history_async(self, ticker: str, period: str = '1mo') -> Dict[str, Any]:
+        """Async variant of get_price_history using the shared aiohttp session."""
+        try:
+            response = await self._fetch_chart(ticker, period)
+            return self._build_price_history(ticker, period, response)
+
         except Exception as e:
             logger.error(f"Error fetching price history for {ticker}", error=str(e))
             return {
                 'ticker': ticker,
                 'error': f"Failed to fetch price history: {str(e)}"
             }
+
+    def _build_price_history(self, ticker: str, period: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute technical indicators from chart JSON."""
+        if not response or 'chart' not in response or 'result' not in response['chart']:
+            raise Exception("Invalid API response")
+
+        result = response['chart']['result'][0]
+        meta = result.get('meta', {})
+        timestamps = result.get('timestamp', [])
+        indicators = result.get('indicators', {})
+        quotes = indicators.get('quote', [{}])[0]
+
+        # Get closing prices
+        close_prices = quotes.get('close', [])
+
+        # Filter out None values
+        valid_prices = [p for p in close_prices if p is not None]
+
+        if not valid_prices:
+            raise Exception("No valid price data")
+
+        # Calculate moving averages
+        ma_20 = sum(valid_prices[-20:]) / min(20, len(valid_prices)) if len(valid_prices) >= 1 else valid_prices[-1]
+        ma_50 = sum(valid_prices[-50:]) / min(50, len(valid_prices)) if len(valid_prices) >= 1 else valid_prices[-1]
+
+        # Calculate support and resistance levels
+        recent_prices = valid_prices[-30:] if len(valid_prices) >= 30 else valid_prices
+        current_price = valid_prices[-1]
+
+        # Support levels (recent lows)
+        sorted_prices = sorted(recent_prices)
+        support_levels = sorted_prices[:3]
+
+        # Resistance levels (recent highs)
+        resistance_levels = sorted_prices[-3:][::-1]
+
+        # Determine trend
+        if ma_20 > ma_50 * 1.02:
+            trend = 'bullish'
+        elif ma_20 < ma_50 * 0.98:
+            trend = 'bearish'
+        else:
+            trend = 'neutral'
+
+        return {
+            'ticker': ticker,
+            'period': period,
+            'current_price': current_price,
+            'ma_20': ma_20,
+            'ma_50': ma_50,
+            'support_levels': support_levels,
+            'resistance_levels': resistance_levels,
+            'trend': trend,
+            'high': max(valid_prices),
+            'low': min(valid_prices),
+            'volume': sum(quotes.get('volume', [0])),
+        }
     
+    async def fetch_all(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch info, news, price history and financial metrics for all tickers
+        concurrently.
+
+        Uses the native async fetchers over the shared pooled aiohttp
+        session, so N tickers pay roughly one round trip of wall time
+        instead of N x 4 serial round trips. Financial metrics are derived
+        from the already-fetched stock info rather than refetched.
+
+        Args:
+            tickers: Stock ticker symbols
+
+        Returns:
+            Dictionary mapping each ticker to its data bundle with keys
+            'info', 'news', 'history' and 'financials'
+        """
+        async def fetch_bundle(ticker: str) -> Dict[str, Any]:
+            info, news, history = await asyncio.gather(
+                self.get_stock_info_async(ticker),
+                self.get_news_async(ticker, 10),
+                self.get_price_history_async(ticker, '1mo'),
+            )
+            return {
+                'info': info,
+                'news': news,
+                'history': history,
+                'financials': self._build_financial_metrics(ticker, info),
+            }
+
+        bundles = await asyncio.gather(*(fetch_bundle(t) for t in tickers))
+        return dict(zip(tickers, bundles))
+
     def get_financial_metrics(self, ticker: str) -> Dict[str, Any]:
         """
         Get detailed financial metrics for a stock.
@@ -407,21 +568,21 @@ class YahooFinanceTool:
         Returns:
             Dictionary containing financial metrics
         """
+        key = ticker.upper()
+        cached = self._metrics_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Get basic stock info which includes scraped financial data
             stock_info = self.get_stock_info(ticker)
-            
-            return {
-                'ticker': ticker,
-                'market_cap': stock_info.get('market_cap', 0),
-                'pe_ratio': stock_info.get('pe_ratio'),
-                'eps': stock_info.get('eps', 0),
-                'revenue_growth': stock_info.get('revenue_growth', 0),
-                'profit_margin': stock_info.get('profit_margin', 0),
-                'fifty_two_week_high': stock_info.get('fifty_two_week_high', 0),
-                'fifty_two_week_low': stock_info.get('fifty_two_week_low', 0),
-            }
-            
+
+            metrics = self._build_financial_metrics(ticker, stock_info)
+            # Don't pin failed fetches for a full day
+            if 'error' not in stock_info:
+                self._metrics_cache[key] = metrics
+            return metrics
+
         except Exception as e:
             logger.error(f"Error fetching financial metrics for {ticker}", error=str(e))
             return {
@@ -429,3 +590,16 @@ class YahooFinanceTool:
                 'error': f"Failed to fetch financial metrics: {str(e)}"
             }
 
+    def _build_financial_metrics(self, ticker: str, stock_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Reshape stock info into the financial metrics dict."""
+        return {
+            'ticker': ticker,
+            'market_cap': stock_info.get('market_cap', 0),
+            'pe_ratio': stock_info.get('pe_ratio'),
+            'eps': stock_info.get('eps', 0),
+            'revenue_growth': stock_info.get('revenue_growth', 0),
+            'profit_margin': stock_info.get('profit_margin', 0),
+            'fifty_two_week_high': stock_info.get('fifty_two_week_high', 0),
+            'fifty_two_week_low': stock_info.get('fifty_two_week_low', 0),
+        }
+
@@ -32,6 +32,11 @@ export function useWebSocketLogs(requestId, enabled = true) {
       const wsUrl = `ws://localhost:8000/ws/${requestId}`
       const ws = new WebSocket(wsUrl)
 
+      // The server sends log events as binary frames (UTF-8 JSON bytes);
+      // receive them as ArrayBuffer so they can be decoded synchronously
+      // instead of the default Blob, which would need an async read
+      ws.binaryType = 'arraybuffer'
+
       ws.onopen = () => {
         console.log('WebSocket connected:', requestId)
         setIsConnected(true)
@@ -41,7 +46,10 @@ export function useWebSocketLogs(requestId, enabled = true) {
 
       ws.onmessage = (event) => {
         try {
-          const logEvent = JSON.parse(event.data)
+          const text = typeof event.data === 'string'
+            ? event.data
+            : new TextDecoder().decode(event.data)
+          const logEvent = JSON.parse(text)
           
           // Add unique ID for React key
           const logWithId = {